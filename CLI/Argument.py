@@ -5,12 +5,23 @@
 """Contains the implementation for Argument(object)."""
 
 from .Exceptions import Error
+from .Deferred   import Deferred, Computed, known
 
 class Argument(object):
     """
     An abstract base class for derived argument types used by CLI.
+
+    Arguments are created for every instance of an application, so they are
+    kept compact with *__slots__* (no per-instance `__dict__`). Extra attributes
+    cannot be set on an Argument (an AttributeError is raised); a derived class
+    must declare any it needs in its own *__slots__*.
     """
-    def __init__(self, description, default=None, short=None, name=None):
+
+    __slots__ = ("description", "default", "dtype", "short", "name", "lazy", "check",
+            "value", "given")
+
+    def __init__(self, description, default=None, short=None, name=None, lazy=False,
+            dtype=None, check=None):
         """A *description* is required of **all** Arguments.
         A *default* value is required for a Default, Switch, or Flag.
 
@@ -21,7 +32,8 @@ class Argument(object):
         default: ...
             The *value* the Argument should take if it is not provided at
             the command line. When given the *dtype* member will become
-            `type(default)`.
+            `type(default)`. A callable *default* is called (once per process,
+            see CLI.Deferred) only if the value is used, and requires a *dtype*.
 
         short: str
             The single character alternate name for the Argument. For Flags
@@ -31,20 +43,77 @@ class Argument(object):
             When not given, the *name* member will be assigned later from
             the variable name itself. If you wish to overide this implicit
             behavior, specify an alternative name here.
+
+        lazy: bool
+            If True, the value from the command line is coerced into *dtype*
+            on first use rather than when it is parsed (see CLI.Deferred).
+
+        dtype: type
+            The type to coerce values into, if not `type(default)`. Required
+            for a callable *default* (checked when the application registers
+            its members).
+
+        check: callable
+            Called with each value from the command line as it is parsed
+            (before it is coerced); if it returns False, a CLI.Error is raised.
+            It should be cheap (e.g., `str.isdigit`), so that a *lazy*
+            Argument still reports bad values when it is parsed.
         """
 
         self.description = str(description)
         self.default     = default
-        self.dtype       = type(default)
+        self.dtype       = dtype or (None if callable(default) else type(default))
         self.short       = None if not short else str(short)
-        self.value       = self.default
-        self.given       = False
         self.name        = None if not name else str(name)
+        self.lazy        = lazy
+        self.check       = check
+        self.value       = self.initial()
+        self.given       = False
 
 
     def set(self, value):
         """Set the value of the Argument; coerce into self.dtype."""
-        self.value = self.dtype(value)
+        self.value = self.coerce(value)
+
+
+    def coerce(self, value):
+        """Return the *value* coerced into self.dtype, without setting it. If *lazy*,
+        a Deferred is returned and the coercion waits until it is resolved.
+        """
+        if self.check is not None:
+            self.validate(value)
+
+        if self.lazy:
+            return Deferred(value, self.dtype, self.name)
+
+        return self.dtype(value)
+
+
+    def validate(self, value):
+        """Raise an Error if the *check* rejects the *value*."""
+        if not self.check(value):
+            raise Error("For `{}`: `{}` is not a valid value.".format(self.name, value))
+
+
+    def initial(self):
+        """The *value* when the Argument is not given: the *default*, or a Computed
+        that calls it when used if the *default* is callable.
+        """
+        if callable(self.default):
+            return Computed(self.default, self.name)
+
+        return self.default
+
+
+    def shown_default(self):
+        """The *default* as shown in the usage and help. A callable *default* is
+        not called for this: it is shown by its result if that is already known,
+        otherwise by a `<name>` placeholder.
+        """
+        if callable(self.default):
+            return known(self.default, "<{}>".format(self.name))
+
+        return self.default
 
 
     def help(self, spacing=10):
@@ -0,0 +1,251 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Batch.py
+
+"""Implementation of the Batch(SingleMode) application."""
+
+import os
+import sys
+import shlex
+import traceback
+
+from .Required   import Required
+from .Switch     import Switch
+from .Flag       import Flag
+from .SingleMode import SingleMode
+from .Capture    import capture
+from .Runner     import new_loop
+from .Pool       import Worker, exit_status, status_of, workers, replay
+
+
+def dispatch(app, argv):
+    """Run the *app* for a single command line *argv* (including the program name)
+    in this process; return its exit status. An exit or an uncaught exception
+    ends only this command line. The *argv* may not itself start a `--batch` or
+    a `shell`, at any level of the application.
+    """
+
+    return status_of(lambda: app(argv).Exe(intercept=False))
+
+
+async def dispatch_async(app, argv):
+    """As *dispatch*, but await the *app* on the running event loop (see
+    SingleMode.ExeAsync), so that many command lines can run at once.
+    """
+
+    try:
+        code = await app(argv).ExeAsync(intercept=False)
+
+    except SystemExit as exit:
+        code = exit.code
+
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    return exit_status(code)
+
+
+def work(job):
+    """Run the command line of a (lineno, line) *job* in a worker process (see
+    CLI.Pool, the Worker holds the app, program and source); return the
+    (lineno, status, output, error), or None for a blank line.
+    """
+
+    lineno, line = job
+    try:
+        argv = shlex.split(line, comments=True)
+    except ValueError as error:
+        return lineno, 1, "", "{}:{}: {}\n".format(Worker["source"], lineno, error)
+
+    if not argv:
+        return None
+
+    with capture() as (output, error):
+        status = dispatch(Worker["app"], [Worker["program"]] + argv)
+
+    return lineno, status, output.getvalue(), error.getvalue()
+
+
+class Batch(SingleMode):
+    """Run many command lines through this application in a single process, or
+    across a pool of worker processes with `--jobs`. Each line of the *source*
+    is split like a shell command and dispatched as if it had been given on the
+    command line. With `--async`, the lines run as concurrent tasks on a single
+    event loop instead (for applications with an `async def main`). The exit
+    status of each line is reported on stderr, after its output.
+    """
+
+    def __init__(self, argv, app=None, program=None):
+        """Accepts the *argv* following `--batch`, the MultiMode *app* class to
+        dispatch to and the *program* name to give it.
+        """
+
+        super(Batch, self).__init__(argv)
+
+        self.app     = app
+        self.program = program
+
+        self.source     = Required("file of command lines (`-` for stdin)")
+        self.fail_fast  = Flag("stop at the first failing line", False, "x", name="fail-fast")
+        self.jobs       = Switch("worker processes to run lines in (0 for one per CPU), or "
+                "with `--async` the most lines to run at a time", 1, "j")
+        self.chunksize  = Switch("lines sent to a worker at a time", 64, "c")
+        self.unordered  = Flag("report lines as they finish rather than in order", False, "u")
+        self.concurrent = Flag("run lines as tasks on one event loop, all at once unless "
+                "`--jobs` is given", False, "a", name="async")
+
+
+    def dispatch(self, argv):
+        """Run a single command line; return its exit status."""
+        return dispatch(self.app, [self.program] + argv)
+
+
+    def main(self):
+        """Dispatch each of the command lines in the *source*."""
+
+        if self.source == "-":
+            return self.run(sys.stdin)
+
+        with open(self.source) as stream:
+            return self.run(stream)
+
+
+    def run(self, stream):
+        """Dispatch each of the command lines in the *stream*; return the first
+        non-zero exit status (or zero if all succeeded).
+        """
+
+        jobs = self.jobs or os.cpu_count() or 1
+        if self.concurrent:
+            # without `--jobs`, there is no limit on the lines running at once
+            limit   = self.jobs if self.Registry["jobs"].given else 0
+            results = self.concurrently(stream, limit)
+        elif jobs == 1:
+            results = self.serial(stream)
+        else:
+            results = self.parallel(stream, jobs)
+
+        result = 0
+        try:
+            for lineno, status in results:
+
+                # keep the report in step with the output of the line
+                sys.stdout.flush()
+                print("{}:{}: exit status {}".format(self.source, lineno, status),
+                        file=sys.stderr)
+
+                if status != 0:
+                    result = result or status
+                    if self.fail_fast:
+                        break
+
+        finally:
+            results.close()
+
+        return result
+
+
+    def serial(self, stream):
+        """Dispatch the command lines of the *stream* in turn, in this process;
+        yield the (lineno, status) of each.
+        """
+
+        for lineno, line in enumerate(stream, 1):
+
+            try:
+                argv = shlex.split(line, comments=True)
+            except ValueError as error:
+                print("{}:{}: {}".format(self.source, lineno, error), file=sys.stderr)
+                yield lineno, 1
+                continue
+
+            if argv:
+                yield lineno, self.dispatch(argv)
+
+
+    def parallel(self, stream, jobs):
+        """Dispatch the command lines of the *stream* across a pool of *jobs* worker
+        processes, in chunks of *chunksize* lines. The output of each line is
+        captured by the worker and written here, with its (lineno, status)
+        yielded, in order unless *unordered*.
+        """
+
+        from .Server import warm
+
+        # import and register everything once, before the workers are forked
+        warm(self.app, self.program)
+
+        with workers(jobs, app=self.app, program=self.program, source=self.source) as pool:
+            collect = pool.imap_unordered if self.unordered else pool.imap
+            yield from replay(collect(work, enumerate(stream, 1), max(1, self.chunksize)))
+
+
+    def concurrently(self, stream, jobs):
+        """Dispatch the command lines of the *stream* as tasks on one event loop,
+        at most *jobs* at a time (any number if zero). The output of each line is
+        captured and written here, with its (lineno, status) yielded, in order
+        unless *unordered*.
+        """
+
+        import asyncio
+        from collections import deque
+
+        loop    = new_loop(self.uvloop)
+        pending = deque()
+        try:
+            for job in enumerate(stream, 1):
+                pending.append(loop.create_task(self.task(*job)))
+                while jobs and len(pending) >= jobs:
+                    yield from self.finish(loop, pending)
+
+            while pending:
+                yield from self.finish(loop, pending)
+
+        finally:
+            if pending:
+                for task in pending:
+                    task.cancel()
+                loop.run_until_complete(asyncio.wait(pending))
+            loop.close()
+
+
+    def finish(self, loop, pending):
+        """Run the *loop* until the first of the *pending* tasks is done (any of
+        them if *unordered*); write the output of the finished lines and yield
+        their (lineno, status).
+        """
+
+        import asyncio
+
+        if self.unordered:
+            done, _ = loop.run_until_complete(asyncio.wait(pending,
+                    return_when=asyncio.FIRST_COMPLETED))
+            done = sorted(done, key=pending.index)
+            for task in done:
+                pending.remove(task)
+        else:
+            done = [pending[0]]
+            loop.run_until_complete(done[0])
+            pending.popleft()
+
+        yield from replay(task.result() for task in done)
+
+
+    async def task(self, lineno, line):
+        """Run the command line of a *lineno* and *line* as a task; return the
+        (lineno, status, output, error), or None for a blank line.
+        """
+
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as error:
+            return lineno, 1, "", "{}:{}: {}\n".format(self.source, lineno, error)
+
+        if not argv:
+            return None
+
+        with capture() as (output, error):
+            status = await dispatch_async(self.app, [self.program] + argv)
+
+        return lineno, status, output.getvalue(), error.getvalue()
@@ -0,0 +1,125 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Cache.py
+
+"""An optional on-disk cache for text rendered from an application class.
+
+The cache is enabled by naming a directory with the `CLI_CACHE` environment
+variable. There is one JSON file per class; it is discarded whenever the
+modification time of the module that defines the class changes. The cache is
+best-effort: any failure to read or write it is ignored.
+"""
+
+import os
+import sys
+
+
+def directory():
+    """The cache directory, or None if the cache is disabled."""
+    return os.environ.get("CLI_CACHE") or None
+
+
+def home():
+    """The cache directory, or ~/.cache/CLI-Python if the cache is disabled. This
+    is where files kept regardless of the cache (e.g., completion) are stored.
+    """
+    return directory() or os.path.join(os.path.expanduser("~"), ".cache", "CLI-Python")
+
+
+def source_of(cls):
+    """The path of the module file that defines *cls*, or None."""
+    module = sys.modules.get(cls.__module__)
+    return getattr(module, "__file__", None)
+
+
+def stamp(path):
+    """The modification time of *path* in nanoseconds, or None."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+
+def path_for(cls, base=None):
+    """The cache file for *cls* within *base* (the cache directory by default)."""
+
+    base = base or directory()
+    if base is None:
+        return None
+
+    import re
+    name = re.sub(r"[^\w.-]", "_", "{}.{}".format(cls.__module__, cls.__qualname__))
+    return os.path.join(base, name + ".json")
+
+
+def read(path):
+    """Read a cache file, returning an empty record if it does not exist."""
+
+    import json
+    try:
+        with open(path) as stream:
+            return json.load(stream)
+    except (OSError, ValueError):
+        return {}
+
+
+def write(path, record):
+    """Atomically replace the cache file at *path* with the *record*."""
+
+    # only needed when writing; keep them off the import path of every application
+    import json
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(handle, "w") as stream:
+            json.dump(record, stream)
+        os.replace(temp, path)
+    except OSError:
+        pass
+
+
+def load(cls, name, key, base=None):
+    """Return the *name*d entry cached for *cls* if it was stored with the same
+    *key* and the source of *cls* has not changed since; otherwise None.
+    """
+
+    path = path_for(cls, base)
+    if path is None:
+        return None
+
+    mtime = stamp(source_of(cls))
+    if mtime is None:
+        return None
+
+    record = read(path)
+    if record.get("mtime") != mtime:
+        return None
+
+    entry = record.get("entries", {}).get(name)
+    if entry is None or entry[0] != key:
+        return None
+
+    return entry[1]
+
+
+def store(cls, name, key, value, base=None):
+    """Cache the *value* (which must be JSON serializable) as the *name*d entry
+    for *cls*, along with its *key*.
+    """
+
+    path = path_for(cls, base)
+    if path is None:
+        return
+
+    mtime = stamp(source_of(cls))
+    if mtime is None:
+        return
+
+    record = read(path)
+    if record.get("mtime") != mtime:
+        record = {"source": source_of(cls), "mtime": mtime, "entries": {}}
+
+    record["entries"][name] = [key, value]
+    write(path, record)
@@ -0,0 +1,87 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Capture.py
+
+"""Capture what an application prints, separately for each thread (or task).
+
+`capture()` installs a Stream in place of sys.stdout and sys.stderr the first
+time it is used. A Stream writes to the buffers of the capture active in the
+current context, and passes through to the original stream otherwise, so
+concurrent captures do not see each other's output.
+"""
+
+import io
+import sys
+import threading
+import contextlib
+import contextvars
+
+
+# the (stdout, stderr) buffers of the capture active in the current context
+Target = contextvars.ContextVar("Target", default=None)
+
+# guards the installation of the Streams
+Lock = threading.Lock()
+
+
+class Stream(object):
+    """Stands in for sys.stdout (*index* 0) or sys.stderr (*index* 1)."""
+
+    def __init__(self, stream, index):
+        """Wrap the original *stream*."""
+        self.stream = stream
+        self.index  = index
+
+
+    def write(self, text):
+        buffers = Target.get()
+        if buffers is None:
+            return self.stream.write(text)
+
+        return buffers[self.index].write(text)
+
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+
+    def flush(self):
+        if Target.get() is None:
+            self.stream.flush()
+
+
+    def isatty(self):
+        return Target.get() is None and self.stream.isatty()
+
+
+    def __getattr__(self, name):
+        # anything else (e.g., fileno, encoding) is that of the original stream
+        return getattr(self.stream, name)
+
+
+def install():
+    """Put a Stream in place of sys.stdout and sys.stderr (if not already)."""
+
+    with Lock:
+        if not isinstance(sys.stdout, Stream):
+            sys.stdout = Stream(sys.stdout, 0)
+        if not isinstance(sys.stderr, Stream):
+            sys.stderr = Stream(sys.stderr, 1)
+
+
+@contextlib.contextmanager
+def capture():
+    """Capture the output in the current context; yields the (stdout, stderr)
+    buffers as io.StringIO.
+    """
+
+    if not isinstance(sys.stdout, Stream) or not isinstance(sys.stderr, Stream):
+        install()
+
+    buffers = (io.StringIO(), io.StringIO())
+    token = Target.set(buffers)
+    try:
+        yield buffers
+    finally:
+        Target.reset(token)
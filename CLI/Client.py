@@ -0,0 +1,94 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Client.py
+
+"""A thin client for an application served by CLI.Server.
+
+usage: python -m CLI.Client /path/to/socket [ARGS...]
+
+The ARGS are passed to the application as they would be on the command line.
+The exit status is that of the application; if it was terminated by a signal,
+the client terminates itself with the same signal. Signals sent to the client
+(e.g., ^C) are forwarded to the process running the command.
+"""
+
+import os
+import sys
+import json
+import struct
+import signal
+import socket
+
+
+# signals forwarded to the process running the command
+FORWARD = [signal.SIGINT, signal.SIGTERM, signal.SIGHUP, signal.SIGQUIT,
+        signal.SIGUSR1, signal.SIGUSR2, signal.SIGWINCH]
+
+# kinds of status reported by the server
+EXITED   = 0
+SIGNALED = 1
+
+
+def receive(conn, size):
+    """Read exactly *size* bytes from the *conn*."""
+
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("the server closed the connection")
+        data += chunk
+
+    return data
+
+
+def connect(path, argv):
+    """Run *argv* on the server listening at *path*; return the exit status, or
+    the negative signal number that terminated the command.
+    """
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(path)
+
+    payload = json.dumps({"argv": list(argv), "cwd": os.getcwd(),
+        "env": dict(os.environ)}).encode()
+
+    socket.send_fds(conn, [struct.pack("!I", len(payload))], [0, 1, 2])
+    conn.sendall(payload)
+
+    pid = struct.unpack("!i", receive(conn, 4))[0]
+
+    def forward(signum, frame):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    for signum in FORWARD:
+        signal.signal(signum, forward)
+
+    kind, number = struct.unpack("!ii", receive(conn, 8))
+    conn.close()
+
+    return -number if kind == SIGNALED else number
+
+
+def main(argv=None):
+    """Entry point for `python -m CLI.Client`."""
+
+    argv = sys.argv if argv is None else argv
+    if len(argv) < 2 or argv[1] in ("-h", "--help"):
+        print(__doc__.strip())
+        return 0
+
+    status = connect(argv[1], argv[2:])
+    if status < 0:
+        signal.signal(-status, signal.SIG_DFL)
+        os.kill(os.getpid(), -status)
+        return 128 - status
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
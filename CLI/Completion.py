@@ -0,0 +1,238 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Completion.py
+
+"""Shell completion for SingleMode and MultiMode applications.
+
+usage: python -m CLI.Completion script {bash|zsh|fish} PROGRAM module:Class
+       python -m CLI.Completion complete module:Class [WORDS...] CURRENT
+       python -m CLI.Completion index module:Class
+
+The *script* command prints a completion script to be sourced by the shell.
+On each TAB the script calls *complete*, which answers from a precomputed
+index of the Flag, Switch and Terminator names and the SubCommands. The index
+is kept in the cache directory (`CLI_CACHE`, or ~/.cache/CLI-Python) and is
+rebuilt, by importing the application, only when one of the modules it was
+built from has changed. Otherwise the application is never imported.
+"""
+
+import os
+import re
+import sys
+import shlex
+
+from .      import Cache
+from .Trie  import Trie
+
+
+BASH = '''\
+_{function}() {{
+    local IFS=$'\\n'
+    COMPREPLY=( $({python} -m CLI.Completion complete {target} "${{COMP_WORDS[@]:1:COMP_CWORD}}") )
+}}
+complete -o default -F _{function} {program}
+'''
+
+ZSH = '''\
+#compdef {program}
+_{function}() {{
+    local -a candidates
+    candidates=( ${{(f)"$({python} -m CLI.Completion complete {target} "${{(@)words[2,CURRENT]}}")"}} )
+    if (( ${{#candidates}} )); then
+        compadd -- $candidates
+    else
+        _files
+    fi
+}}
+compdef _{function} {program}
+'''
+
+FISH = '''\
+function __{function}_complete
+    set -l words (commandline -opc)
+    set -e words[1]
+    {python} -m CLI.Completion complete {target} $words (commandline -ct)
+end
+complete -c {program} -a '(__{function}_complete)'
+'''
+
+SCRIPTS = {"bash": BASH, "zsh": ZSH, "fish": FISH}
+
+
+def build(cls, name, sources):
+    """Build the completion index for *cls*, recursively for its subcommands;
+    the module file of each class is added to *sources*.
+    """
+
+    from .MultiMode import MultiMode
+
+    app = cls([name])
+    app.register()
+
+    path = Cache.source_of(cls)
+    if path is not None:
+        sources[path] = Cache.stamp(path)
+
+    if isinstance(app, MultiMode):
+        flags, switches = app.AllTerminators, []
+    else:
+        flags, switches = app.AllFlags, app.AllSwitches
+
+    # each option maps to None (a flag) or the default value of a switch
+    options = {}
+    for names, takes_value in [(flags, False), (switches, True)]:
+        for name in names:
+            arg   = app.__dict__[name]
+            value = str(arg.default) if takes_value else None
+            if takes_value and callable(arg.default):
+                # not called just to suggest it (and the index is kept on disk)
+                value = ""
+
+            options["--{}".format(arg.name)] = value
+            if arg.short:
+                options["-{}".format(arg.short)] = value
+
+    index = {"options": options}
+
+    if isinstance(app, MultiMode):
+        index["commands"] = {command: build(app.subcommand(command), command, sources)
+                for command in app.SubCommands}
+
+    return index
+
+
+def path_for(target):
+    """The path of the stored index for *target*."""
+    return os.path.join(Cache.home(), "completion", re.sub(r"[^\w.-]", "_", target) + ".json")
+
+
+def fresh(record):
+    """True if the stored *record* is still valid: none of its sources (including
+    the *origin*, the module named by the target) changed. The sources are only
+    stat'ed; nothing is imported or searched for on the path.
+    """
+
+    if not record or "index" not in record or record.get("origin") not in record["sources"]:
+        return False
+
+    return all(Cache.stamp(path) == mtime for path, mtime in record["sources"].items())
+
+
+def index_for(target, rebuild=False):
+    """Return the completion index for *target* (a `module:Class` string),
+    rebuilding it only if it is missing or stale.
+    """
+
+    path   = path_for(target)
+    record = Cache.read(path)
+    if not rebuild and fresh(record):
+        return record["index"]
+
+    from .Loader import load
+
+    module  = target.partition(":")[0]
+    sources = {}
+    index   = build(load(target), module, sources)
+
+    origin = getattr(sys.modules.get(module), "__file__", None)
+    if origin is not None:
+        sources[origin] = Cache.stamp(origin)
+
+    Cache.write(path, {"target": target, "origin": origin, "sources": sources,
+        "index": index})
+    return index
+
+
+def abbreviates(word, commands):
+    """The one command named or uniquely abbreviated by *word*, or None (by the
+    same rule as the MultiMode, see CLI.Trie).
+    """
+
+    matches = Trie(commands).match(word)
+    return matches[0] if len(matches) == 1 else None
+
+
+def complete(index, words, current):
+    """Return the candidates for the *current* word, given the preceding *words*
+    (not including the program name).
+    """
+
+    node    = index
+    pending = None
+    free    = False
+    for word in words:
+        if pending is not None:
+            pending = None
+
+        elif word in node["options"]:
+            pending = node["options"][word]
+
+        elif word[:1] == "-":
+            continue
+
+        else:
+            command = None if free else abbreviates(word, node.get("commands", {}))
+            if command is None:
+                free = True
+            else:
+                node = node["commands"][command]
+
+    if pending is not None:
+        # suggest the default value for the switch
+        return [pending] if pending and pending.startswith(current) else []
+
+    if current[:1] == "-":
+        return sorted(option for option in node["options"] if option.startswith(current))
+
+    if not free and "commands" in node:
+        return sorted(command for command in node["commands"] if command.startswith(current))
+
+    return []
+
+
+def script(shell, program, target):
+    """Generate the completion *script* for a *shell* (bash, zsh or fish)."""
+
+    if shell not in SCRIPTS:
+        raise ValueError("unsupported shell `{}` (expected one of: {})".format(shell,
+            ", ".join(SCRIPTS)))
+
+    return SCRIPTS[shell].format(function=re.sub(r"\W", "_", program), program=program,
+            python=shlex.quote(sys.executable), target=shlex.quote(target))
+
+
+def main(argv=None):
+    """Entry point for `python -m CLI.Completion`."""
+
+    argv = sys.argv[1:] if argv is None else argv
+
+    if len(argv) >= 3 and argv[0] == "complete":
+        try:
+            candidates = complete(index_for(argv[1]), argv[2:-1], argv[-1])
+        except Exception:
+            # never spill errors into the shell on TAB
+            return 1
+
+        for candidate in candidates:
+            print(candidate)
+        return 0
+
+    if len(argv) == 4 and argv[0] == "script":
+        try:
+            print(script(argv[1], argv[2], argv[3]), end="")
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return 1
+        return 0
+
+    if len(argv) == 2 and argv[0] == "index":
+        index_for(argv[1], rebuild=True)
+        print(path_for(argv[1]))
+        return 0
+
+    print(__doc__.strip())
+    return 0 if argv[:1] in ([], ["-h"], ["--help"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,12 +12,15 @@ class Default(Argument):
     not necessarily need to be provided.
     """
 
-    def __init__(self, description, default, name=None):
+    __slots__ = ()
+
+    def __init__(self, description, default, name=None, lazy=False, dtype=None, check=None):
         """Initialize the new Default(Argument)."""
-        super(Default, self).__init__(description, default, name=name)
+        super(Default, self).__init__(description, default, name=name, lazy=lazy,
+                dtype=dtype, check=check)
 
 
     def help(self, spacing = 10):
         """Return a the *help* string for this *Argument*."""
         return " {}{}{} (default: {}).\n".format(self.name, " " * (spacing - len(self.name)),
-                                                 self.description, self.default)
+                                                 self.description, self.shown_default())
@@ -0,0 +1,214 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Deferred.py
+
+"""Implementation of Deferred(object), Computed(Deferred) and the Resolve descriptor.
+
+The *value* of a *lazy* Required, Default or Switch is a Deferred: the string
+from the command line is kept as is and coerced into the *dtype* the first
+time it is used. Likewise, an Argument with a callable *default* that is not
+given takes a Computed value, which calls the *default* when it is used. After
+*reassign*, the member of the application is read through a Resolve descriptor
+on the class, so `self.path` in *main* gives the final value (computing it
+once) rather than the Deferred.
+
+The result of each callable is kept for the life of the process (see
+*evaluate*), so it is computed at most once however many applications ask,
+unless it closes over something that is not a plain value (e.g., `self`).
+"""
+
+import _thread
+
+from .Exceptions import Error
+
+
+class Deferred(object):
+    """A *value* waiting to be coerced into *dtype* for the Argument *name*."""
+
+    __slots__ = ("raw", "dtype", "name", "value", "done")
+
+    def __init__(self, raw, dtype, name):
+        """Wrap the *raw* value (a string from the command line)."""
+        self.raw   = raw
+        self.dtype = dtype
+        self.name  = name
+        self.value = None
+        self.done  = False
+
+
+    def resolve(self):
+        """Return the coerced value, converting it the first time only."""
+
+        if not self.done:
+            try:
+                self.value = self.dtype(self.raw)
+            except (ValueError, TypeError) as error:
+                raise Error("For `{}`: `{}` could not be converted to {} ({}).".format(
+                    self.name, self.raw, getattr(self.dtype, "__name__", self.dtype), error))
+
+            self.done = True
+
+        return self.value
+
+
+    def __repr__(self):
+        return "Deferred({}, {!r})".format(getattr(self.dtype, "__name__", self.dtype),
+                self.raw)
+
+
+# the results of the callables given to *evaluate*, by *key*
+Results = {}
+
+# guards the evaluation of a callable (so it runs once)
+Lock = _thread.RLock()
+
+# the types of values that may be part of a key: they are compared by value, or
+# live as long as the process (classes and modules), so keeping them is harmless
+Values = (type(None), bool, int, float, complex, str, bytes, type, type(_thread))
+
+
+def stable(value):
+    """Whether the *value* may be part of a key (see Values)."""
+
+    if isinstance(value, (tuple, frozenset)):
+        return all(stable(item) for item in value)
+
+    return isinstance(value, Values)
+
+
+def key(function):
+    """The key of the *function* in the Results, or None if it has none. A `lambda`
+    is created anew with each instance of an application, so functions are
+    identified by their code, the values they close over and their defaults.
+    A function that closes over anything else (e.g., `self`), or a method of an
+    instance, has no key: keeping it would keep its instance alive.
+    """
+
+    if isinstance(function, type):
+        return function
+
+    owner = getattr(function, "__self__", None)
+    if owner is not None:
+        # a method, or a builtin function of a module (e.g., `os.getcwd`)
+        return function if stable(owner) else None
+
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return None
+
+    try:
+        cells = tuple(cell.cell_contents for cell in function.__closure__ or ())
+    except ValueError:
+        # an empty cell
+        return None
+
+    result = (code, cells, function.__defaults__)
+    return result if stable(result[1:]) else None
+
+
+def evaluate(function):
+    """Call the *function* (with no arguments) the first time only; return the
+    result. A *function* without a *key* is called each time.
+    """
+
+    name = key(function)
+    if name is None:
+        return function()
+
+    try:
+        return Results[name]
+    except KeyError:
+        pass
+
+    with Lock:
+        if name not in Results:
+            Results[name] = function()
+
+        return Results[name]
+
+
+def known(function, otherwise=None):
+    """The result of the *function* if it was already evaluated, else *otherwise*."""
+    name = key(function)
+    return otherwise if name is None else Results.get(name, otherwise)
+
+
+class Computed(Deferred):
+    """The *value* of an Argument with a callable *default*, not yet evaluated."""
+
+    __slots__ = ()
+
+    def __init__(self, function, name):
+        """Wrap the *default* *function* of the Argument *name*."""
+        super(Computed, self).__init__(function, None, name)
+
+
+    def resolve(self):
+        """Return the result of the *default* (see *evaluate*)."""
+
+        if not self.done:
+            self.value = evaluate(self.raw)
+            self.done  = True
+
+        return self.value
+
+
+    def __repr__(self):
+        return "Computed({})".format(getattr(self.raw, "__name__", self.raw))
+
+
+class Resolve(object):
+    """A data descriptor for the member *name* of an application class. If the
+    instance holds a Deferred (or Computed) there, it is resolved and replaced on
+    access; anything else (e.g., the Argument itself before *reassign*) is
+    returned as is.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+        if isinstance(value, Deferred):
+            value = instance.__dict__[self.name] = value.resolve()
+
+        return value
+
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+
+    @classmethod
+    def install(cls, owner, name):
+        """Put a Resolve descriptor for *name* on the class *owner* (once). An
+        attribute of the class (or of a base) with the same *name*, such as a
+        method or a property, is never replaced: an Error is raised instead.
+        """
+
+        for base in owner.__mro__:
+            if name in base.__dict__:
+                if type(base.__dict__[name]) is cls:
+                    return
+
+                raise Error("The member `{}` has the name of an attribute of {}; it cannot "
+                        "be *lazy* or have a callable *default*.".format(name, base.__name__))
+
+        setattr(owner, name, cls(name))
@@ -13,3 +13,47 @@ class Error(Exception):
 class Usage(Exception):
     """Call to halt execution."""
     pass
+
+class Message(object):
+    """
+    The text of a Usage given as an iterator of *pieces*, so that it can be
+    written out as it is rendered (see CLI.Writer). Iterating yields the pieces
+    (those already read first); as a str it is the whole text.
+    """
+
+    __slots__ = ("pieces", "parts")
+
+    def __init__(self, pieces):
+        self.pieces = pieces
+        self.parts  = []
+
+    def __iter__(self):
+        yield from list(self.parts)
+        for piece in self.pieces:
+            self.parts.append(piece)
+            yield piece
+
+    def __str__(self):
+        self.parts.extend(self.pieces)
+        return "".join(self.parts)
+
+    def __repr__(self):
+        return repr(str(self))
+
+def handle(error, pager=False, exceptions=False):
+    """The exit status of *Exe* when it stops with a Usage or an Error. The text
+    of a Usage is shown (through $PAGER if *pager*, see CLI.Writer) and the
+    status is zero; an Error is printed (or re-raised, if *exceptions*) and the
+    status is one.
+    """
+
+    if isinstance(error, Usage):
+        from .Writer import display
+        display(error.args[0], pager=pager)
+        return 0
+
+    if exceptions:
+        raise error
+
+    print(error)
+    return 1
@@ -0,0 +1,79 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/FanOut.py
+
+"""Run the *each* method of a SingleMode application over the items of its List
+argument, across a pool of threads or processes (see *fan_out* on SingleMode).
+The output of each item is captured and written in the order of the items.
+"""
+
+import os
+
+from .Capture    import capture
+from .Pool       import Worker, status_of, workers, replay
+from .Exceptions import Error
+
+
+def each(app, item):
+    """Run *app.each(item)*, printing a CLI.Error rather than raising it."""
+
+    try:
+        return app.each(item)
+
+    except Error as error:
+        print(error)
+        return 1
+
+
+def call(app, item):
+    """Run *app.each(item)*; return its exit status. An exit or an exception ends
+    only this item (see CLI.Pool.status_of).
+    """
+    return status_of(each, app, item)
+
+
+def captured(app, item):
+    """As *call*, but return the (status, output, error)."""
+
+    with capture() as (output, error):
+        status = call(app, item)
+
+    return status, output.getvalue(), error.getvalue()
+
+
+def work(item):
+    """Run an *item* in a worker process (see CLI.Pool), see *captured*."""
+    return captured(Worker["app"], item)
+
+
+def fan_out(app, items, mode, jobs, chunksize=1):
+    """Run *app.each* over the *items* with *jobs* threads or processes (*mode*);
+    return the first non-zero exit status, or zero.
+    """
+
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1:
+        results = ((call(app, item), "", "") for item in items)
+        return collect(results)
+
+    if mode == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(jobs) as executor:
+            return collect(executor.map(lambda item: captured(app, item), items))
+
+    with workers(jobs, app=app) as pool:
+        return collect(pool.imap(work, items, max(1, chunksize)))
+
+
+def collect(results):
+    """Write out the output of each of the (status, output, error) *results* in
+    turn (see CLI.Pool.replay); return the first non-zero status, or zero.
+    """
+
+    result = 0
+    for status, in replay(results):
+        result = result or status
+
+    return result
@@ -14,19 +14,22 @@ class Flag(Argument):
     *short* name (e.g., -abc).
     """
 
+    __slots__ = ()
+
     def __init__(self, description, default, short=None, name=None):
         """Initialize the new Flag(Argument)."""
-        super(Flag, self).__init__(description, default=default, short=short, name=name)
+        super(Flag, self).__init__(description, default=default, short=short, name=name,
+                dtype=bool)
 
 
     def help(self, spacing = 10):
         """Return the *help* string for this *Argument*."""
         if not self.short:
             return " --{}{}{} (default: {}).\n".format(self.name, " " *
-                    (spacing - len(self.name) - 2), self.description, self.default)
+                    (spacing - len(self.name) - 2), self.description, self.shown_default())
         else:
             return " -{}, --{}{}{} (default: {}).\n".format(self.short, self.name,
-                    " " * (spacing - len(self.name) - 6), self.description, self.default)
+                    " " * (spacing - len(self.name) - 6), self.description, self.shown_default())
 
 
     def set(self, value):
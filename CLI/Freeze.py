@@ -0,0 +1,249 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Freeze.py
+
+"""Ahead-of-time compilation of the argument specs for an application.
+
+usage: python -m CLI.Freeze module:Class [-o frozen.py] [--check]
+
+The generated module installs a frozen Spec for the application and each of
+its subcommands: the kind lists, the token tables used to resolve every `-x`
+and `--name` option, and the pre-rendered usage and help text. Applications
+started through it (run the module itself, or import it before calling *Exe*)
+skip the reflection over their members and the validation in *register*. If
+the source of a class has changed since, or an instance has other members, its
+frozen Spec is set aside and the class is registered as usual.
+"""
+
+import io
+import os
+import sys
+import shlex
+import pprint
+import difflib
+import contextlib
+
+from .Required   import Required
+from .Switch     import Switch
+from .Flag       import Flag
+from .SingleMode import SingleMode
+from .MultiMode  import MultiMode
+from .Spec       import Spec
+from .Loader     import load
+from .Exceptions import Error
+
+
+HEADER = '''\
+# Generated by CLI.Freeze from {target}; do not edit.
+
+"""Frozen parser for {target}.
+
+Importing this module installs the pre-compiled argument specs so that the
+application skips the registration and validation of its members.
+"""
+
+import sys
+
+from CLI.Spec   import Spec
+from CLI.Loader import load
+
+'''
+
+ENTRY = '''
+
+def main(argv=None):
+    """Run {target} with the frozen parser."""
+    return load({target!r})(sys.argv if argv is None else argv).Exe()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+'''
+
+
+def sources_of(cls):
+    """The (path, mtime) of the source file of *cls* and of each of its bases
+    (outside of CLI itself). A frozen Spec is no longer trusted if any of these
+    have changed (see Spec.current).
+    """
+
+    sources = {}
+    for base in cls.__mro__:
+        path = getattr(sys.modules.get(base.__module__), "__file__", None)
+        if path is not None and base.__module__.partition(".")[0] != "CLI":
+            path = os.path.abspath(path)
+            sources.setdefault(path, os.stat(path).st_mtime_ns)
+
+    return tuple(sources.items())
+
+
+def collect(cls, name):
+    """Register *cls* (and its subcommands, recursively) and return a list of
+    (key, fields) for each class, the *fields* being the (name, value) of each
+    argument to give Spec.freeze.
+    """
+
+    if not (issubclass(cls, SingleMode) or issubclass(cls, MultiMode)):
+        raise Error("`{}` is not a SingleMode or MultiMode application!".format(cls))
+
+    app = cls([name])
+    members = tuple(app.__dict__)
+    app.register()
+
+    fields = [("names", tuple(app.Registry)),
+              ("tables", {table: app.__dict__[table] for table in app.Tables})]
+
+    if isinstance(app, SingleMode):
+        fields += [("usage", app.usage_body()), ("help", app.help_body())]
+    else:
+        fields += [("usage", app.usage_pieces()), ("help", app.help_body()),
+                   ("commands", tuple(app.SubCommands))]
+
+    fields += [("members", members), ("sources", sources_of(cls))]
+    specs = [(Spec.key(cls), fields)]
+
+    if isinstance(app, MultiMode):
+        for command in app.SubCommands:
+            specs.extend(collect(app.subcommand(command), command))
+
+    return specs
+
+
+def render(target, cls, name):
+    """Generate the source of the frozen module for *cls*."""
+
+    source = HEADER.format(target=target)
+
+    for key, fields in collect(cls, name):
+        source += "Spec.freeze({!r},\n".format(key)
+        for index, (field, value) in enumerate(fields, 1):
+            literal = pprint.pformat(value, width=88 - len(field), sort_dicts=False)
+            source += "    {}={}{}\n".format(field, literal.replace("\n", "\n" +
+                " " * (len(field) + 5)), "," if index < len(fields) else ")")
+        source += "\n"
+
+    return source + ENTRY.format(target=target)
+
+
+def samples_for(cls, name):
+    """Generate the default command lines to check for *cls*; these exercise the
+    usage, help and Terminators of the application and its subcommands.
+    """
+
+    app = cls([name])
+    app.register()
+
+    samples = [[], ["-h"], ["--help"]]
+    for arg in app.AllTerminators:
+        samples.append(["--{}".format(app.__dict__[arg].name)])
+        if app.__dict__[arg].short:
+            samples.append(["-{}".format(app.__dict__[arg].short)])
+
+    if isinstance(app, MultiMode):
+        for command in app.SubCommands:
+            samples.extend([command] + argv for argv in
+                    samples_for(app.subcommand(command), command))
+
+    return samples
+
+
+def run(cls, name, argv):
+    """Run the application with *argv* and return its (exit status, output). An
+    uncaught exception is reported in place of the exit status.
+    """
+
+    stream = io.StringIO()
+    with contextlib.redirect_stdout(stream):
+        try:
+            status = cls([name] + argv).Exe()
+        except SystemExit as exit:
+            status = exit.code
+        except Exception as error:
+            status = "{}: {}".format(type(error).__name__, error)
+
+    return status, stream.getvalue()
+
+
+def check(cls, name, source, samples):
+    """Run each of the *samples* through the dynamic and the frozen parser and
+    return a list of differences (empty if they agree).
+    """
+
+    keys   = [spec[0] for spec in collect(cls, name)]
+    cached = {key: Spec.Compiled.pop(key, None) for key in keys}
+
+    try:
+        dynamic = [run(cls, name, argv) for argv in samples]
+
+        exec(compile(source, "<frozen>", "exec"), {"__name__": "frozen"})
+        frozen  = [run(cls, name, argv) for argv in samples]
+
+    finally:
+        for key, spec in cached.items():
+            if spec is not None:
+                Spec.Compiled[key] = spec
+            else:
+                Spec.Compiled.pop(key, None)
+
+    differences = []
+    for argv, (dstatus, doutput), (fstatus, foutput) in zip(samples, dynamic, frozen):
+        if dstatus != fstatus or doutput != foutput:
+            command = " ".join([name] + [shlex.quote(arg) for arg in argv])
+            diff = "".join(difflib.unified_diff(doutput.splitlines(True),
+                foutput.splitlines(True), "dynamic", "frozen"))
+            differences.append("{}: exit status {} (dynamic) vs {} (frozen)\n{}".format(
+                command, dstatus, fstatus, diff))
+
+    return differences
+
+
+class Freeze(SingleMode):
+    """Generate a frozen parser module for a SingleMode or MultiMode application.
+    The *target* is given as `module:Class` and must be importable.
+    """
+
+    def __init__(self, argv):
+        """Define the arguments for the freeze command."""
+
+        super(Freeze, self).__init__(argv)
+
+        self.target  = Required("the application, as `module:Class`")
+        self.output  = Switch("path for the generated module", "-", "o")
+        self.samples = Switch("file of extra command lines to check", "", "s")
+        self.check   = Flag("diff the frozen parser against the dynamic one", False, "c")
+
+
+    def main(self):
+        """Generate (and optionally check) the frozen module."""
+
+        cls  = load(self.target)
+        name = self.target.partition(":")[0].rpartition(".")[2]
+
+        source = render(self.target, cls, name)
+
+        if self.output == "-":
+            print(source, end="")
+        else:
+            with open(self.output, "w") as module:
+                module.write(source)
+
+        if not self.check:
+            return 0
+
+        samples = samples_for(cls, name)
+        if self.samples:
+            with open(self.samples) as lines:
+                samples.extend(shlex.split(line) for line in lines if line.strip())
+
+        differences = check(cls, name, source, samples)
+        for difference in differences:
+            print(difference, file=sys.stderr)
+
+        print("{} of {} command lines differ.".format(len(differences), len(samples)),
+                file=sys.stderr)
+
+        return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit( Freeze(sys.argv).Exe() )
@@ -0,0 +1,59 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/LazyList.py
+
+"""Implementation of LazyList(Sequence)."""
+
+from collections.abc import Sequence
+
+from .Exceptions import Error
+
+class LazyList(Sequence):
+    """The *value* of a lazy List(Argument). Elements are coerced into *dtype*
+    on each access; nothing is converted (or kept) ahead of time.
+    """
+
+    __slots__ = ("values", "dtype", "name")
+
+    def __init__(self, values, dtype, name):
+        """Wrap the raw *values* (not copied) of the List named *name*."""
+        self.values = values
+        self.dtype  = dtype
+        self.name   = name
+
+
+    def coerce(self, index, value):
+        """Coerce the *value* at *index*, reporting failures with the index."""
+        try:
+            return self.dtype(value)
+        except (ValueError, TypeError) as error:
+            raise Error("For `{}`: element {} (`{}`) could not be converted to {} ({})."
+                    .format(self.name, index, value, getattr(self.dtype, "__name__", self.dtype),
+                    error))
+
+
+    def __len__(self):
+        return len(self.values)
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.coerce(i, self.values[i])
+                    for i in range(*index.indices(len(self.values)))]
+
+        if index < 0:
+            index += len(self.values)
+            if index < 0:
+                raise IndexError("LazyList index out of range")
+
+        return self.coerce(index, self.values[index])
+
+
+    def __iter__(self):
+        for index, value in enumerate(self.values):
+            yield self.coerce(index, value)
+
+
+    def __repr__(self):
+        return "LazyList({}, {} elements)".format(getattr(self.dtype, "__name__", self.dtype),
+                len(self.values))
@@ -4,7 +4,8 @@
 
 """Implementation of List(Argument)."""
 
-from .Argument import Argument
+from .Argument   import Argument
+from .Exceptions import Error
 
 class List(Argument):
     """A List *Argument* is similar to a Required(Argument), with the important
@@ -12,10 +13,35 @@ class List(Argument):
     line.
     """
 
-    def __init__(self, description, dtype=str, name=None):
-        """Initialize the new List(Argument)."""
-        super(List, self).__init__(description, name=name)
+    __slots__ = ("array",)
+
+    # array.array type codes for the numeric *dtype*s
+    TypeCodes = {int: "q", float: "d"}
+
+    def __init__(self, description, dtype=str, name=None, lazy=False, array=False,
+            check=None):
+        """Initialize the new List(Argument).
+
+        lazy: bool
+            If True, the *value* is a LazyList that coerces each element into
+            *dtype* when it is accessed, rather than all of them up front.
+
+        array: bool
+            If True, the values are parsed in one pass into a contiguous numeric
+            buffer: a NumPy array if NumPy is installed, otherwise an
+            array.array. The *dtype* must be int or float.
+        """
+        super(List, self).__init__(description, name=name, lazy=lazy, check=check)
         self.dtype = dtype
+        self.array = array
+
+        if array and dtype not in self.TypeCodes:
+            raise Error("For List(Argument) `{}`: *array* requires a *dtype* of int or "
+                    "float!".format(self.name or description))
+
+        if array and lazy:
+            raise Error("For List(Argument) `{}`: *array* and *lazy* cannot be "
+                    "combined!".format(self.name or description))
 
 
     def help(self, spacing = 10):
@@ -24,6 +50,39 @@ class List(Argument):
                 self.description)
 
 
-    def set(self, value):
+    def coerce(self, value):
         """Specialization for List argument."""
-        self.value = [ self.dtype(v) for v in value ]
+        if self.check is not None:
+            for element in value:
+                self.validate(element)
+
+        if self.lazy:
+            from .LazyList import LazyList
+            return LazyList(value, self.dtype, self.name)
+        elif self.array:
+            return self.to_array(value)
+        else:
+            return [ self.dtype(v) for v in value ]
+
+
+    def to_array(self, values):
+        """Parse the *values* into a NumPy array (or an array.array without NumPy)."""
+
+        import array
+
+        try:
+            try:
+                import numpy
+            except ImportError:
+                return array.array(self.TypeCodes[self.dtype], map(self.dtype, values))
+            else:
+                return numpy.array(values, dtype=self.dtype)
+
+        except (ValueError, TypeError, OverflowError) as error:
+            # find the offending element to report it
+            from .LazyList import LazyList
+            for element in LazyList(values, self.dtype, self.name):
+                pass
+
+            raise Error("For `{}`: the values could not be stored as {} ({}).".format(
+                self.name, self.dtype.__name__, error))
@@ -0,0 +1,60 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Loader.py
+
+"""Resolve `module:Class` import strings to application classes."""
+
+from .Exceptions import Error
+from .Deferred   import key
+
+
+# targets already resolved by *resolve*
+Resolved = {}
+
+
+def load(target):
+    """Import and return the object named by *target* (e.g., `calc:Calc`). The
+    part after the colon may be a dotted path (e.g., `app:Outer.Inner`).
+    """
+
+    module_name, sep, qualname = str(target).partition(":")
+    if not sep or not module_name or not qualname:
+        raise Error("`{}` should be given as `module:Class`!".format(target))
+
+    import importlib
+
+    try:
+        obj = importlib.import_module(module_name)
+    except ImportError as error:
+        raise Error("Could not import `{}` ({}).".format(module_name, error))
+
+    for attr in qualname.split("."):
+        try:
+            obj = getattr(obj, attr)
+        except AttributeError:
+            raise Error("`{}` has no member `{}`!".format(module_name, qualname))
+
+    return obj
+
+
+def resolve(target):
+    """Return the application class for a *target*, which is either the class
+    itself, a `module:Class` import string, or a callable returning the class.
+    Import strings and callables are only resolved once. SubCommands are given
+    anew with each instance, so a callable (e.g., a `lambda`) is known by its
+    code and the values it closes over (see CLI.Deferred.key); one that cannot
+    be (e.g., a method of an instance, or a `lambda` using `self`) is called
+    each time rather than kept.
+    """
+
+    if isinstance(target, type):
+        return target
+
+    name = target if isinstance(target, str) else key(target)
+    if name is None:
+        return target()
+
+    if name not in Resolved:
+        Resolved[name] = load(target) if isinstance(target, str) else target()
+
+    return Resolved[name]
@@ -8,11 +8,22 @@ import os
 
 from .Argument import Argument
 from .Terminator import Terminator
-from .Exceptions import Error, Usage
+from .Spec import Spec
+from .Trie import Trie
+from .Suggestions import Suggestions, hint
+from .Loader import resolve
+from .Exceptions import Error, Usage, Message, handle
 
 class MultiMode(object):
     """A MultiMode application has several subcommands, each of which is
-    a SingleMode application in and of its self.
+    a SingleMode application in and of its self, or another MultiMode
+    with subcommands of its own. A subcommand may be abbreviated to any
+    prefix that does not also start another.
+
+    Giving `--batch FILE` (or `--batch -` for stdin) runs each line of the
+    file as a separate command line in this one process (see CLI.Batch).
+    Unless the application has its own `shell` subcommand, `shell` reads
+    and runs command lines interactively (see CLI.Shell).
     """
 
     def __init__(self, argv):
@@ -25,11 +36,17 @@ class MultiMode(object):
         self.SubCommands = {}
         self.AllTerminators = []
 
+        # the compiled Spec for this application (see register)
+        self.Spec = None
+
+        # if True, show the help through $PAGER on a terminal (see CLI.Writer)
+        self.pager = False
+
         # default member, all MultiMode applications have this options
         self.help = Terminator("show this message", "", "h")
 
 
-    def Exe(self, reassign=True, exceptions=False):
+    def Exe(self, reassign=True, exceptions=False, intercept=True):
         """Parse the *argv* and run the called *subcommand*.
 
         reassign: bool
@@ -38,28 +55,107 @@ class MultiMode(object):
 
         exceptions: bool
             If true, re-raise the CLI.Error when caught.
+
+        intercept: bool
+            If False, `--batch` and `shell` are not run here or by any
+            *subcommand* (as for the command lines of a Batch, Shell or
+            Router, which must not open files or read stdin themselves).
         """
 
+        if intercept and self.argv[:1] == ["--batch"]:
+            from .Batch import Batch
+            return Batch(["{} --batch".format(self.name)] + self.argv[1:], app=type(self),
+                    program=self.name).Exe(reassign=reassign, exceptions=exceptions)
+
+        if intercept and self.argv[:1] == ["shell"] and "shell" not in self.SubCommands:
+            from .Shell import Shell
+            return Shell(["{} shell".format(self.name)] + self.argv[1:], app=type(self),
+                    program=self.name).Exe(reassign=reassign, exceptions=exceptions)
+
         try:
 
-            self.rc()
-            return self.SubCommands[self.argv[0]](self.argv).Exe(reassign=reassign,
-                    exceptions=False)
+            app = self.select()
+            if app is None:
+                return 2
+
+            return app.Exe(reassign=reassign, exceptions=False, intercept=intercept)
+
+        except (Usage, Error) as error:
+            return handle(error, self.pager, exceptions)
+
+
+    async def ExeAsync(self, reassign=True, exceptions=False, intercept=True):
+        """As *Exe*, but await the *subcommand* on the running event loop (see
+        SingleMode.ExeAsync). The `--batch` and `shell` modes run as with *Exe*.
+        """
+
+        if intercept and (self.argv[:1] == ["--batch"] or (self.argv[:1] == ["shell"] and
+                "shell" not in self.SubCommands)):
+            return self.Exe(reassign=reassign, exceptions=exceptions)
+
+        try:
+
+            app = self.select()
+            if app is None:
+                return 2
+
+            return await app.ExeAsync(reassign=reassign, exceptions=False,
+                    intercept=intercept)
+
+        except (Usage, Error) as error:
+            return handle(error, self.pager, exceptions)
+
+
+    def select(self):
+        """Parse the *argv* and return the instance of the called *subcommand*.
+        If the name is unknown or ambiguous, say so and return None.
+        """
+
+        self.rc()
+
+        matches = self.match(self.argv[0])
+        if len(matches) != 1:
+            if not matches:
+                print("`{}` is not an available subcommand!{}".format(self.argv[0],
+                    hint(self.suggestions("commands", self.SubCommands, self.argv[0]))))
+            else:
+                print("`{}` is ambiguous: it could mean {}.".format(self.argv[0],
+                    ", ".join("`{}`".format(command) for command in matches)))
+            return None
+
+        command = matches[0]
+        return self.subcommand(command)([command] + self.argv[1:])
+
 
-        except Usage as usage:
-            print(usage)
-            return 0
+    def match(self, word):
+        """Return the list of *SubCommands* that *word* could name: the one equal
+        to it or uniquely abbreviated by it, otherwise all those it abbreviates.
+        The names are kept in a Trie, built once per class (see Spec.trie).
+        """
+
+        if self.Spec is None:
+            return Trie(self.SubCommands).match(word)
+
+        return self.Spec.trie(self.SubCommands).match(word)
 
-        except Error as error:
-            if exceptions:
-                raise
 
-            print(error)
-            return 1
+    def suggestions(self, kind, names, word):
+        """The *names* of a *kind* closest to an unknown *word* (see CLI.Suggestions)."""
 
-        except KeyError as error:
-            print("`{}` is not an available subcommand!".format(self.argv[0]))
-            return 2
+        names = tuple(names)
+        if self.Spec is None:
+            return Suggestions(names).suggest(word)
+
+        return self.Spec.suggestions(kind, names, word)
+
+
+    def subcommand(self, command):
+        """Return the application class for *command*. The *SubCommands* may be
+        given as classes, as `module:Class` import strings, or as callables that
+        return the class; the latter two are only imported here, at dispatch.
+        """
+
+        return resolve(self.SubCommands[command])
 
 
     def rc(self):
@@ -74,21 +170,39 @@ class MultiMode(object):
             self.interpret(self.argv[0])
 
         if self.help.given:
-            raise Usage(self.help_statement())
+            raise Usage(Message(self.help_pieces()))
+
+        for name in self.AllTerminators:
+            if self.__dict__[name].given:
+                raise Usage(self.__dict__[name].message())
+
 
-        for name, arg in self.__dict__.items():
-            if name in self.AllTerminators and arg.given:
-                raise Usage(arg.information)
+    # the members compiled into the Spec by register
+    Tables = ["AllTerminators", "ShortNames", "LongNames"]
 
 
     def register(self):
         """Register all the member Arguments (strip self.__dict__ of non-Argument
-        types). The only allowed member Arguments are Terminators.
+        types). The only allowed member Arguments are Terminators. As with the
+        SingleMode, the result is compiled into a Spec once per class.
         """
 
+        spec = Spec.lookup(type(self))
+        if spec is not None and spec.frozen and spec.current(self):
+            self.Registry = {name: self.__dict__[name] for name in spec.names}
+            spec.apply(self)
+            return
+
         self.Registry = {name: arg for name, arg in self.__dict__.items()
                 if issubclass(type(arg), Argument)}
 
+        # the names of the SubCommands are part of the signature (see Spec.trie)
+        commands  = tuple(self.SubCommands)
+        signature = Spec.signature_of(self.Registry)
+        if spec is not None and spec.signature == signature and spec.commands == commands:
+            spec.apply(self)
+            return
+
         for name, arg in self.Registry.items():
 
             if isinstance(arg, Terminator):
@@ -108,6 +222,23 @@ class MultiMode(object):
         if len(name_set) != len(self.Registry):
             raise Error("There is a *name* clash the Argument members of {}!".format(self.name))
 
+        self.index()
+
+        self.Spec = Spec.compile(self, signature, self.Tables, commands)
+        Spec.install(type(self), self.Spec)
+
+
+    def index(self):
+        """Build the lookup tables used to resolve `-x` and `--name` options."""
+
+        self.ShortNames = {}
+        self.LongNames  = {}
+
+        for arg in self.AllTerminators:
+            self.LongNames[self.__dict__[arg].name] = arg
+            if self.__dict__[arg].short:
+                self.ShortNames.setdefault(self.__dict__[arg].short, arg)
+
 
     def interpret(self, flag):
         """Interpret a Terminator passed from rc()."""
@@ -129,61 +260,98 @@ class MultiMode(object):
     def long_form(self, flag):
         """Interpret a long form flag argument."""
 
-        for arg in self.Registry:
-            if self.__dict__[arg].name == flag:
-                self.__dict__[arg].given = True
-                return
+        arg = self.LongNames.get(flag)
+        if arg is None:
+            raise Error("--{} does not name a flag!{}".format(flag,
+                hint(self.suggestions("options", self.LongNames, flag))))
 
-        raise Error("--{} does not name a flag!".format(flag))
+        self.__dict__[arg].given = True
 
 
     def short_form(self, flag):
         """Interpret a short form flag argument."""
 
-        for arg in self.Registry:
-            if self.__dict__[arg].short and self.__dict__[arg].short == flag:
-                self.__dict__[arg].given = True
-                return
+        arg = self.ShortNames.get(flag)
+        if arg is None:
+            raise Error("-{} does not name a flag!".format(flag))
 
-        raise Error("-{} does not name a flag!".format(flag))
+        self.__dict__[arg].given = True
 
 
     def usage_statement(self):
         """Generate the usage string for this application."""
 
         tab = " " * (7 + len(self.name))
+        return "usage: {}{}".format(self.name, tab.join(self.rendered()[0]))
 
-        longest_subcommand = 0
-        for command in self.SubCommands:
-            if len(command) > longest_subcommand:
-                longest_subcommand = len(command)
 
-        message = "usage: {}".format(self.name)
+    def help_statement(self):
+        """Generate the help string for this application."""
+        return "".join(self.help_pieces())
 
-        for command in self.SubCommands:
-            message += " {}{} ...\n{}".format(command, " " * (longest_subcommand -
-                len(command) + 2), tab)
 
-        message += "\n{}".format(self.__doc__)
-        return message
+    def help_pieces(self):
+        """Yield the help statement in pieces, so it can be written out without
+        first building the whole text (see CLI.Writer).
+        """
 
+        usage, body = self.rendered()
 
-    def help_statement(self):
-        """Generate the help string for this application."""
+        tab = " " * (7 + len(self.name))
+        yield "usage: {}".format(self.name)
+        for index, piece in enumerate(usage):
+            yield tab + piece if index else piece
 
-        message = self.usage_statement()
+        yield body
+
+        if self.info:
+            yield "\n{}".format(self.info)
 
-        spacing = 0
-        for flag in self.AllTerminators:
-            if len(self.__dict__[flag].name) > spacing:
-                spacing = len(self.__dict__[flag].name)
 
-        spacing += 10
+    def rendered(self):
+        """The usage statement (as pieces, see *usage_pieces*) and the help for each
+        Terminator. These are rendered once per class and memoized in its Spec.
+        """
 
-        for flag in self.AllTerminators:
-            message += self.__dict__[flag].help()
+        if self.Spec is None:
+            return self.render()
 
-        if self.info:
-            message += "\n{}".format(self.info)
+        return self.Spec.text(self, self.render_key, self.render)
+
+
+    def render_key(self):
+        """The parts of the rendered text that may differ between instances."""
+
+        return repr([self.__doc__, list(self.SubCommands), [self.__dict__[flag].description
+            for flag in self.AllTerminators]])
+
+
+    def render(self):
+        """Render the usage statement and help (see *rendered*)."""
+
+        return self.usage_pieces(), self.help_body()
+
+
+    def usage_pieces(self):
+        """Render the usage statement following the program name. The pieces are
+        joined by the indentation, which depends on the length of the name.
+        """
+
+        longest_subcommand = 0
+        for command in self.SubCommands:
+            if len(command) > longest_subcommand:
+                longest_subcommand = len(command)
+
+        pieces = []
+        for command in self.SubCommands:
+            pieces.append(" {}{} ...\n".format(command, " " * (longest_subcommand -
+                len(command) + 2)))
+
+        pieces.append("\n{}".format(self.__doc__))
+        return tuple(pieces)
+
+
+    def help_body(self):
+        """Render the help for each Terminator (following the usage statement)."""
 
-        return message
+        return "".join(self.__dict__[flag].help() for flag in self.AllTerminators)
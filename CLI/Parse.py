@@ -0,0 +1,95 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Parse.py
+
+"""A functional interface to the SingleMode parser.
+
+`parse(App, argv)` returns the parsed values as an immutable namespace without
+constructing (or changing) an instance of the application on each call. One
+registered instance of each class serves as a read-only template, so the same
+class may be parsed from any number of threads at once.
+"""
+
+import os
+import _thread
+
+from .SingleMode import SingleMode
+from .Exceptions import Error, Usage
+
+
+# the registered template and namespace type for each application class
+Templates = {}
+
+# guards the creation of the Templates (`_thread`, as `threading` is slow to import)
+Lock = _thread.allocate_lock()
+
+
+def template(cls):
+    """Return the (app, Namespace, defaults) for the application class *cls*,
+    registering the template instance the first time.
+    """
+
+    entry = Templates.get(cls)
+    if entry is not None:
+        return entry
+
+    with Lock:
+        entry = Templates.get(cls)
+        if entry is not None:
+            return entry
+
+        if not issubclass(cls, SingleMode):
+            raise Error("CLI.parse requires a SingleMode application, not {}".format(cls))
+
+        from collections import namedtuple
+
+        app = cls([cls.__name__])
+        app.register()
+
+        try:
+            Namespace = namedtuple("{}Namespace".format(cls.__name__), app.Registry)
+        except ValueError as error:
+            raise Error("The members of {} cannot be used as a namespace ({}).".format(
+                cls.__name__, error))
+
+        defaults = tuple(arg.initial() for arg in app.Registry.values())
+
+        entry = Templates[cls] = (app, Namespace, defaults)
+        return entry
+
+
+def parse(cls, argv):
+    """Parse the command line *argv* (including the program name) for the
+    SingleMode application class *cls*. Returns a namedtuple of the value of
+    each member Argument; neither the class nor any instance is changed. The
+    value of a *lazy* Argument (or of a callable *default*) is a Deferred,
+    coerced (or called) by its *resolve* method.
+
+    As with *rc*, an invalid command line raises a CLI.Error and a request for
+    help (or a Terminator) raises a CLI.Usage with the message to display.
+    """
+
+    app, Namespace, defaults = template(cls)
+
+    name = os.path.basename(argv[0])
+    args = argv[1:]
+
+    if not args:
+        raise Usage(app.usage_statement(name))
+
+    tokens = args
+    if app.response_files:
+        from .Response import expand
+        tokens = expand(args)
+    given, switches, free = app.scan(tokens)
+
+    if "help" in given:
+        raise Usage(app.help_statement(name))
+
+    for flag in app.AllTerminators:
+        if flag in given:
+            raise Usage(app.Registry[flag].message())
+
+    values = app.assign(given, switches, free)
+    return Namespace._make([values.get(member, default)
+        for member, default in zip(app.Registry, defaults)])
@@ -0,0 +1,95 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Pool.py
+
+"""Exit statuses and worker processes, shared by CLI.Batch, CLI.FanOut and
+CLI.Server.
+
+A worker process runs one unit of work at a time (a command line, an item)
+with its output captured; the parent writes that output out as each result
+is collected (see *replay*), so the output of each unit stays together.
+"""
+
+import sys
+import signal
+import traceback
+import contextlib
+
+
+def exit_status(code):
+    """The exit status for a *code* returned by *Exe* (or given to SystemExit),
+    by the rules of *sys.exit*: None is zero, an int is itself, and anything
+    else is printed to stderr and is one.
+    """
+
+    if code is None:
+        return 0
+
+    if isinstance(code, int):
+        return code
+
+    print(code, file=sys.stderr)
+    return 1
+
+
+def status_of(function, *args):
+    """Call *function(\\*args)* and return its exit status (see *exit_status*).
+    An exit or an uncaught exception (whose traceback is printed) ends only this
+    call.
+    """
+
+    try:
+        code = function(*args)
+
+    except SystemExit as exit:
+        code = exit.code
+
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+    return exit_status(code)
+
+
+# the state given to a worker process, see *start*
+Worker = {}
+
+
+def start(state):
+    """Initialize a worker process with the *state* (kept in the Worker)."""
+
+    # an interrupt is handled by the parent, which stops the workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    Worker.update(state)
+
+
+@contextlib.contextmanager
+def workers(jobs, **state):
+    """A multiprocessing Pool of *jobs* worker processes, each started with the
+    *state*. The workers are stopped on leaving the context, however it is left.
+    """
+
+    import multiprocessing
+
+    pool = multiprocessing.Pool(jobs, initializer=start, initargs=(state,))
+    try:
+        yield pool
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def replay(results):
+    """Write out the captured output of each of the *results*, which end with
+    their (output, error), in turn; yield the rest of each. A result of None
+    (nothing was run) is skipped.
+    """
+
+    for result in results:
+        if result is None:
+            continue
+
+        sys.stdout.write(result[-2])
+        sys.stdout.flush()
+        sys.stderr.write(result[-1])
+        yield result[:-2]
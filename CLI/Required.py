@@ -10,9 +10,11 @@ from .Argument import Argument
 class Required(Argument):
     """A Required *Argument* is one with no *default* value."""
 
-    def __init__(self, description, dtype=str, name=None):
+    __slots__ = ()
+
+    def __init__(self, description, dtype=str, name=None, lazy=False, check=None):
         """Initialize the new Required(Argument)."""
-        super(Required, self).__init__(description, name=name)
+        super(Required, self).__init__(description, name=name, lazy=lazy, check=check)
         self.dtype = dtype
 
 
@@ -0,0 +1,118 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Response.py
+
+"""Expansion of `@path` response files on the command line.
+
+A response file holds one argument per line, or NUL-delimited arguments
+(e.g., from `find -print0`) if it contains any NUL byte. `@-` reads them from
+stdin. Arguments within a response file may themselves name response files,
+up to *MaxDepth* levels deep.
+"""
+
+import os
+import sys
+import stat
+import mmap
+
+from .Exceptions import Error
+
+
+# how deeply response files may be nested
+MaxDepth = 8
+
+# bytes read from stdin at a time
+ChunkSize = 1 << 16
+
+
+def expand(argv, depth=0):
+    """Yield the arguments in *argv*, replacing each `@path` with the arguments
+    read from that file. Files are read incrementally as the result is consumed.
+    """
+
+    for arg in argv:
+        if arg[:1] == "@" and len(arg) > 1:
+
+            if depth >= MaxDepth:
+                raise Error("Response files are nested more than {} deep at `{}`!"
+                        .format(MaxDepth, arg))
+
+            if arg == "@-":
+                tokens = read_stream(sys.stdin.buffer)
+            else:
+                tokens = read_file(arg[1:])
+
+            for token in expand(tokens, depth + 1):
+                yield token
+
+        else:
+            yield arg
+
+
+def read_file(path):
+    """Yield the arguments from the response file at *path* through a memory map.
+    Anything but a regular file (e.g., a pipe from `@<(find -print0)`, a FIFO or
+    `@/dev/stdin`) reports no size, and is read as a stream instead.
+    """
+
+    try:
+        stream = open(path, "rb")
+    except OSError as error:
+        raise Error("Could not read the response file `{}` ({}).".format(path,
+            error.strerror))
+
+    with stream:
+        status = os.fstat(stream.fileno())
+        if not stat.S_ISREG(status.st_mode):
+            yield from read_stream(stream)
+            return
+
+        if status.st_size == 0:
+            return
+
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            delimiter = b"\0" if buffer.find(b"\0") != -1 else b"\n"
+
+            position, size = 0, len(buffer)
+            while position < size:
+                end = buffer.find(delimiter, position)
+                if end == -1:
+                    end = size
+
+                token = buffer[position:end]
+                position = end + 1
+
+                if delimiter == b"\n":
+                    token = token.rstrip(b"\r")
+                if token:
+                    yield os.fsdecode(token)
+
+
+def read_stream(stream):
+    """Yield the arguments from a binary *stream* (e.g., stdin), read in chunks.
+    The delimiter is chosen from the first chunk.
+    """
+
+    delimiter = None
+    remainder = b""
+    while True:
+        chunk = stream.read(ChunkSize)
+        if not chunk:
+            break
+
+        if delimiter is None:
+            delimiter = b"\0" if b"\0" in chunk else b"\n"
+
+        tokens = (remainder + chunk).split(delimiter)
+        remainder = tokens.pop()
+
+        for token in tokens:
+            if delimiter == b"\n":
+                token = token.rstrip(b"\r")
+            if token:
+                yield os.fsdecode(token)
+
+    if delimiter == b"\n":
+        remainder = remainder.rstrip(b"\r")
+    if remainder:
+        yield os.fsdecode(remainder)
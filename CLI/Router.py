@@ -0,0 +1,81 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Router.py
+
+"""Implementation of Router(object)."""
+
+import re
+import shlex
+from functools   import lru_cache
+from collections import namedtuple
+
+from .Loader  import resolve
+from .Batch   import dispatch
+from .Capture import capture
+
+
+# the outcome of a routed command: exit status, stdout and stderr
+Result = namedtuple("Result", ["code", "output", "error"])
+
+# characters that need the full shell-like tokenizer
+Special = re.compile(r"[\"'\\]")
+
+# the whitespace recognized by shlex
+Whitespace = re.compile(r"[ \t\r\n]+")
+
+
+def split(command):
+    """Split a *command* string like a shell would; returns a tuple. Strings
+    without quotes or escapes (most of them) are split without shlex.
+    """
+
+    if Special.search(command) is None:
+        return tuple(token for token in Whitespace.split(command) if token)
+
+    return tuple(shlex.split(command))
+
+
+class Router(object):
+    """
+    A Router runs command strings (e.g., from a chat bot or an RPC endpoint)
+    through an application in this process and returns a Result, rather than
+    printing. Neither *sys.argv* nor the process is touched, and the output of
+    each command is captured separately, so a Router may be called from many
+    threads at once. A command may not start a `--batch` or a `shell`, at any
+    level of the application, as these would read files or stdin.
+    """
+
+    def __init__(self, app, program=None, cache=4096):
+        """Route to the application *app* (a class, or a `module:Class` import
+        string, see CLI.Loader).
+
+        program: str
+            The program name given to the application (used in its usage
+            statements). Defaults to the name of the class, in lower case.
+
+        cache: int
+            The number of recent command strings whose tokens are kept.
+        """
+
+        self.app     = resolve(app)
+        self.program = program or self.app.__name__.lower()
+        self.split   = lru_cache(maxsize=cache)(split)
+
+
+    def __call__(self, command):
+        """Route the *command* string, see *route*."""
+        return self.route(command)
+
+
+    def route(self, command):
+        """Run the *command* string through the application; return the Result."""
+
+        try:
+            argv = self.split(command)
+        except ValueError as error:
+            return Result(2, "", "{}\n".format(error))
+
+        with capture() as (output, error):
+            code = dispatch(self.app, [self.program] + list(argv))
+
+        return Result(code, output.getvalue(), error.getvalue())
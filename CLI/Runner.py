@@ -0,0 +1,57 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Runner.py
+
+"""Run the coroutine of an `async def main` to completion on an event loop."""
+
+
+def factory(uvloop=False):
+    """The uvloop event loop factory if *uvloop* is True and it is installed,
+    otherwise None (for the asyncio default).
+    """
+
+    if not uvloop:
+        return None
+
+    try:
+        import uvloop as module
+    except ImportError:
+        return None
+
+    return module.new_event_loop
+
+
+def new_loop(uvloop=False):
+    """A new event loop, from uvloop if *uvloop* is True and it is installed."""
+
+    import asyncio
+    return (factory(uvloop) or asyncio.new_event_loop)()
+
+
+def run(coroutine, uvloop=False):
+    """Run the *coroutine* on a new event loop (see *new_loop*) and return its
+    result. An interrupt (^C) cancels the coroutine, and 130 is returned.
+    """
+
+    import asyncio
+
+    try:
+        if hasattr(asyncio, "Runner"):
+            with asyncio.Runner(loop_factory=factory(uvloop)) as runner:
+                return runner.run(coroutine)
+
+        loop = new_loop(uvloop)
+        try:
+            asyncio.set_event_loop(loop)
+            return loop.run_until_complete(coroutine)
+        finally:
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    except KeyboardInterrupt:
+        # the coroutine and any tasks it left behind have been cancelled
+        return 130
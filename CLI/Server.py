@@ -0,0 +1,245 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Server.py
+
+"""A resident, pre-warmed process for running an application (see CLI.Client).
+
+usage: python -m CLI.Server module:Class /path/to/socket [-p NAME]
+
+The server imports the application (and every subcommand of a MultiMode)
+once, then listens on a Unix domain socket. Each client sends its argv, cwd
+and environment along with its stdin, stdout and stderr file descriptors.
+The server forks a child that adopts these and runs *Exe*; the exit status,
+or the signal that terminated the child, is sent back to the client.
+
+protocol (all integers are network byte order):
+
+    client -> server:  4 byte length, with fds 0, 1, 2 attached (SCM_RIGHTS)
+                       JSON payload {"argv": [...], "cwd": "...", "env": {...}}
+    server -> client:  4 byte pid of the child running the command
+                       4 byte kind (0 exit status, 1 signal), 4 byte number
+"""
+
+import os
+import sys
+import json
+import struct
+import signal
+import socket
+import selectors
+import traceback
+
+from .Required   import Required
+from .Switch     import Switch
+from .SingleMode import SingleMode
+from .MultiMode  import MultiMode
+from .Loader     import load
+from .Pool       import exit_status
+from .Exceptions import Error
+
+
+# kinds of status reported to the client
+EXITED   = 0
+SIGNALED = 1
+
+
+def receive(conn, size):
+    """Read exactly *size* bytes from the *conn*."""
+
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise Error("The connection closed unexpectedly.")
+        data += chunk
+
+    return data
+
+
+def warm(app, name):
+    """Register the *app* class, and recursively its subcommands, so that their
+    modules are imported and their Specs compiled before any child is forked.
+    """
+
+    instance = app([name])
+    instance.register()
+
+    if isinstance(instance, MultiMode):
+        instance.Spec.trie(instance.SubCommands)
+        for command in instance.SubCommands:
+            warm(instance.subcommand(command), command)
+
+
+class Server(SingleMode):
+    """Serve an application from a resident, pre-warmed process. Clients connect
+    through the Unix domain *socket* with `python -m CLI.Client`.
+    """
+
+    def __init__(self, argv):
+        """Define the arguments for the server."""
+
+        super(Server, self).__init__(argv)
+
+        self.target  = Required("the application, as `module:Class`")
+        self.socket  = Required("path of the Unix domain socket")
+        self.program = Switch("program name given to the application", "", "p")
+
+
+    def main(self):
+        """Warm the application and serve clients until interrupted."""
+
+        app     = load(self.target)
+        program = self.program or self.target.partition(":")[0].rpartition(".")[2]
+        warm(app, program)
+
+        if os.path.exists(self.socket):
+            os.unlink(self.socket)
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket)
+        listener.listen(socket.SOMAXCONN)
+
+        try:
+            self.serve(listener, app, program)
+
+        except KeyboardInterrupt:
+            return 0
+
+        finally:
+            listener.close()
+            os.unlink(self.socket)
+
+
+    def serve(self, listener, app, program):
+        """Accept connections and fork a child for each; report the status of
+        each child to its client as it is reaped.
+        """
+
+        # SIGCHLD wakes the selector through this pipe
+        wakeup, alarm = os.pipe()
+        os.set_blocking(alarm, False)
+        signal.set_wakeup_fd(alarm)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+        selector = selectors.DefaultSelector()
+        selector.register(listener, selectors.EVENT_READ)
+        selector.register(wakeup, selectors.EVENT_READ)
+
+        children = {}
+        while True:
+            for key, events in selector.select():
+
+                if key.fileobj is listener:
+                    conn, address = listener.accept()
+
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+
+                    pid = os.fork()
+                    if pid == 0:
+                        listener.close()
+                        selector.close()
+                        os.close(wakeup)
+                        os.close(alarm)
+                        self.child(conn, app, program)
+
+                    children[pid] = conn
+                    self.send(conn, struct.pack("!i", pid))
+
+                else:
+                    os.read(wakeup, 4096)
+
+            self.reap(children)
+
+
+    def reap(self, children):
+        """Collect any finished children and report their status."""
+
+        while children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+
+            conn = children.pop(pid, None)
+            if conn is None:
+                continue
+
+            if os.WIFSIGNALED(status):
+                self.send(conn, struct.pack("!ii", SIGNALED, os.WTERMSIG(status)))
+            else:
+                self.send(conn, struct.pack("!ii", EXITED, os.WEXITSTATUS(status)))
+
+            conn.close()
+
+
+    def send(self, conn, data):
+        """Send *data* to a client, which may have gone away."""
+
+        try:
+            conn.sendall(data)
+        except OSError:
+            pass
+
+
+    def child(self, conn, app, program):
+        """Adopt the client's request and run the application; never returns.
+        Nothing may escape into the server's loop from here (it would go on to
+        remove the socket), so every path ends with *os._exit*.
+        """
+
+        status = 1
+        try:
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.default_int_handler)
+
+            header, fds, flags, address = socket.recv_fds(conn, 4, 3)
+            request = json.loads(receive(conn, struct.unpack("!I", header)[0]).decode())
+            conn.close()
+
+            for fd, target in zip(fds, (0, 1, 2)):
+                os.dup2(fd, target)
+                os.close(fd)
+
+            # line buffered on a terminal, as at interpreter startup
+            sys.stdin  = open(0, "r", closefd=False)
+            sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)
+            sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+            os.chdir(request["cwd"])
+            os.environ.clear()
+            os.environ.update(request["env"])
+
+            sys.argv = [program] + request["argv"]
+            status = exit_status(app(sys.argv).Exe())
+
+        except SystemExit as exit:
+            status = self.attempt(exit_status, exit.code)
+
+        except KeyboardInterrupt:
+            # terminate the way an interrupted process would
+            self.attempt(sys.stdout.flush)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            os.kill(os.getpid(), signal.SIGINT)
+
+        except BaseException:
+            self.attempt(traceback.print_exc)
+
+        finally:
+            self.attempt(sys.stdout.flush)
+            self.attempt(sys.stderr.flush)
+            os._exit(status & 0xFF if isinstance(status, int) else 1)
+
+
+    @staticmethod
+    def attempt(function, *args):
+        """Call *function* in a child; on any failure return 1 (an exit status)."""
+
+        try:
+            return function(*args)
+        except BaseException:
+            return 1
+
+
+if __name__ == "__main__":
+    sys.exit( Server(sys.argv).Exe() )
@@ -0,0 +1,181 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Shell.py
+
+"""Implementation of the Shell(SingleMode) application."""
+
+import os
+import sys
+import shlex
+
+from .Switch     import Switch
+from .SingleMode import SingleMode
+from .Batch      import dispatch
+from .           import Cache
+
+
+class Shell(SingleMode):
+    """Run the subcommands of this application interactively, in one process.
+    Each line is split like a shell command and dispatched as if it had been
+    given on the command line, so imports and compiled specs stay warm between
+    commands. Enter `exit` (or ^D) to leave.
+    """
+
+    def __init__(self, argv, app=None, program=None):
+        """Accepts the *argv* following `shell`, the MultiMode *app* class to
+        dispatch to and the *program* name to give it.
+        """
+
+        super(Shell, self).__init__(argv)
+
+        self.app     = app
+        self.program = program
+
+        self.history = Switch("file to keep the command history in (default: in the "
+                "cache directory)", "", "H")
+
+        # the completion index (see CLI.Completion), built at the first TAB
+        self.completions = None
+
+        # the exit status of the last command
+        self.status = 0
+
+
+    def rc(self):
+        """As for the SingleMode, but no arguments are required."""
+
+        if not self.argv:
+            self.register()
+            return
+
+        super(Shell, self).rc()
+
+
+    def main(self):
+        """Read and dispatch command lines until the end of the input."""
+
+        try:
+            import readline
+        except ImportError:
+            # e.g., on Windows; lines are still read, without history or completion
+            readline = None
+
+        history = self.history or os.path.join(Cache.home(), "history", self.program)
+        if readline is not None:
+            self.setup(readline, history)
+
+        prompt = "{}> ".format(self.program) if sys.stdin.isatty() else ""
+        try:
+            while True:
+                try:
+                    line = input(prompt)
+                except EOFError:
+                    if prompt:
+                        print()
+                    break
+                except KeyboardInterrupt:
+                    # discard the line being typed
+                    print()
+                    continue
+
+                if not self.run(line):
+                    break
+
+        finally:
+            if readline is not None:
+                try:
+                    os.makedirs(os.path.dirname(history) or ".", exist_ok=True)
+                    readline.write_history_file(history)
+                except OSError:
+                    pass
+
+        return self.status
+
+
+    def run(self, line):
+        """Dispatch a single command *line*; return False to leave the shell."""
+
+        try:
+            argv = shlex.split(line, comments=True)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            return True
+
+        if not argv:
+            return True
+
+        if argv[0] in ("exit", "quit"):
+            return False
+
+        if argv[0] == "shell":
+            print("Already in the shell.", file=sys.stderr)
+            return True
+
+        try:
+            self.status = dispatch(self.app, [self.program] + argv)
+        except KeyboardInterrupt:
+            # stop the command, not the shell
+            print()
+            self.status = 130
+
+        return True
+
+
+    def setup(self, readline, history):
+        """Load the *history* and install the completer."""
+
+        try:
+            readline.read_history_file(history)
+        except OSError:
+            pass
+
+        readline.set_history_length(1000)
+
+        # complete whole options (e.g., --name), not the part after a `-`
+        readline.set_completer_delims(" \t\n")
+        readline.set_completer(self.completer(readline))
+        readline.parse_and_bind("tab: complete")
+
+
+    def completer(self, readline):
+        """Return the function given to *readline.set_completer*. Candidates are
+        drawn from the SubCommands and their Arguments (see CLI.Completion).
+        """
+
+        candidates = []
+
+        def complete(text, state):
+            if state == 0:
+                line  = readline.get_line_buffer()[:readline.get_begidx()]
+                words = line.split()
+                candidates[:] = self.candidates(words, text)
+                if len(candidates) == 1:
+                    # a complete word; go on to the next
+                    candidates[0] += " "
+
+            return candidates[state] if state < len(candidates) else None
+
+        return complete
+
+
+    def candidates(self, words, current):
+        """The completions of the *current* word following the *words*."""
+
+        # imported here; CLI.Completion also runs as `python -m CLI.Completion`,
+        # which warns if importing CLI had already imported it
+        from . import Completion
+
+        try:
+            if self.completions is None:
+                self.completions = Completion.build(self.app, self.program, {})
+
+            found = Completion.complete(self.completions, words, current)
+
+        except Exception:
+            # never interrupt the line being edited
+            return []
+
+        if not words:
+            found += [word for word in ("exit", "quit") if word.startswith(current)]
+
+        return found
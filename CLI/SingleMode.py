@@ -13,7 +13,10 @@ from .Switch     import Switch
 from .Flag       import Flag
 from .Terminator import Terminator
 from .List       import List
-from .Exceptions import Error, Usage
+from .Spec       import Spec
+from .Deferred   import Deferred, Resolve
+from .Suggestions import Suggestions, hint
+from .Exceptions import Error, Usage, Message, handle
 
 class SingleMode(object):
     """A SingleMode application is one for which there is a single,
@@ -28,8 +31,7 @@ class SingleMode(object):
         self.argv = list(argv[1:])
         self.info = None
 
-        self.Remainder      = {}
-        self.GivenSwitches  = {}
+        self.Remainder      = []
 
         self.AllRequired    = []
         self.AllDefaults    = []
@@ -38,18 +40,58 @@ class SingleMode(object):
         self.AllTerminators = []
         self.AllLists       = []
 
+        # the compiled Spec for this application (see register)
+        self.Spec = None
+
+        # if True, expand `@path` response files in *argv* (see CLI.Response)
+        self.response_files = False
+
+        # if True, show the help through $PAGER on a terminal (see CLI.Writer)
+        self.pager = False
+
+        # if "thread" or "process", *main* runs *each* over the items of the List
+        # across a pool of that kind, with a `--jobs` switch (see CLI.FanOut)
+        self.fan_out   = None
+        self.chunksize = 1
+
+        # if True, an `async def main` runs on a uvloop event loop (if installed)
+        self.uvloop = False
+
         # default member, all SingleMode applications have this option
         self.help = Flag("show this message", False, "h")
 
 
+    # the members compiled into the Spec by register
+    Tables = ["AllRequired", "AllDefaults", "AllSwitches", "AllFlags", "AllTerminators",
+            "AllLists", "ShortFlags", "ShortSwitches", "LongFlags", "LongSwitches"]
+
+
     def register(self):
         """Register all the member Arguments. Strip self.__dict__ of non-Argument
-        types.
+        types. The result is compiled into a Spec the first time a class is
+        registered; later instances reuse it and skip the validation.
         """
 
+        spec   = Spec.lookup(type(self))
+        frozen = spec is not None and spec.frozen and spec.current(self)
+
+        if self.fan_out and "jobs" not in self.__dict__:
+            self.jobs = Switch("items to run at once (0 for one per CPU)", 1, "j")
+
+        if frozen:
+            # a current frozen Spec is trusted; no reflection over the members
+            self.Registry = {name: self.__dict__[name] for name in spec.names}
+            spec.apply(self)
+            return
+
         self.Registry = {name: arg for name, arg in self.__dict__.items()
                 if issubclass(type(arg), Argument)}
 
+        signature = Spec.signature_of(self.Registry)
+        if spec is not None and spec.signature == signature:
+            spec.apply(self)
+            return
+
         for name, arg in self.Registry.items():
 
             if isinstance(arg, Required):
@@ -75,279 +117,460 @@ class SingleMode(object):
                 raise Error("Untracked Argument type for SingleMode."
                         "{} is not implementented.".format(type(arg)))
 
-            if len(self.Registry) < 1:
-                raise Error("There were no member Arguments defined for this "
-                        "application! This program can never run!")
+        if len(self.Registry) < 1:
+            raise Error("There were no member Arguments defined for this "
+                    "application! This program can never run!")
+
+        if len(self.AllLists) > 1:
+            raise Error("There can only be one List argument! Having more "
+                    "than one List is an ill-defined application.")
 
-            if len(self.AllLists) > 1:
-                raise Error("There can only be one List argument! Having more "
-                        "than one List is an ill-defined application.")
+        if self.fan_out not in (None, "thread", "process"):
+            raise Error("The *fan_out* should be \"thread\" or \"process\", not "
+                    "{!r}".format(self.fan_out))
 
-            # attach a `name` member to all Argument members
-            for names in self.Registry:
-                if not self.__dict__[names].name:
-                    self.__dict__[names].name = names
+        if self.fan_out and len(self.AllLists) != 1:
+            raise Error("An application with a *fan_out* needs a List argument "
+                    "to run *each* over!")
 
-            # check the *default* value types for boolean Flags
-            for names in self.AllFlags:
-                if type(self.__dict__[names].default) is not bool:
-                    raise Error("For Flag(Argument) `{}`: the *default* value must "
-                            "be of {}".format(names, bool))
+        # attach a `name` member to all Argument members
+        for names in self.Registry:
+            if not self.__dict__[names].name:
+                self.__dict__[names].name = names
+
+        # check the *default* value types for boolean Flags (a callable is not
+        # called to check it)
+        for names in self.AllFlags:
+            default = self.__dict__[names].default
+            if type(default) is not bool and not callable(default):
+                raise Error("For Flag(Argument) `{}`: the *default* value must "
+                        "be of {}".format(names, bool))
+
+        # a callable *default* is not called to find the type of its values
+        for names in self.AllDefaults + self.AllSwitches:
+            if self.__dict__[names].dtype is None:
+                raise Error("For `{}`: a callable *default* requires a *dtype*.".format(names))
+
+        # Flags must have a single character `short` for the flag stacking to work
+        for arg in self.Registry:
+            if self.__dict__[arg].short and len(self.__dict__[arg].short) != 1:
+                raise Error("For `{}`: the *short* form name should be a single "
+                     "character in length!".format(arg))
+
+        # no Arguments can share a `name`
+        name_set = set([self.__dict__[arg].name for arg in self.Registry])
+        if len(name_set) != len(self.Registry):
+            raise Error("There was an Argument *name* clash in {}".format(self.name))
+
+        self.index()
+
+        self.Spec = Spec.compile(self, signature, self.Tables)
+        Spec.install(type(self), self.Spec)
+
+
+    def index(self):
+        """Build the lookup tables used to resolve `-x` and `--name` options.
+        Each option on the command line is then found in constant time rather
+        than by walking all the members.
+        """
 
-            # Flags must have a single character `short` for the flag stacking to work
-            for arg in self.Registry:
-                if self.__dict__[arg].short and len(self.__dict__[arg].short) != 1:
-                    raise Error("For `{}`: the *short* form name should be a single "
-                         "character in length!".format(arg))
+        self.ShortFlags    = {}
+        self.ShortSwitches = {}
+        self.LongFlags     = {}
+        self.LongSwitches  = {}
 
-            # no Arguments can share a `name`
-            name_set = set([self.__dict__[arg].name for arg in self.Registry])
-            if len(name_set) != len(self.Registry):
-                raise Error("There was an Argument *name* clash in {}".format(self.name))
+        for arg in self.AllFlags:
+            self.LongFlags[self.__dict__[arg].name] = arg
+            if self.__dict__[arg].short:
+                self.ShortFlags.setdefault(self.__dict__[arg].short, arg)
+
+        for arg in self.AllSwitches:
+            self.LongSwitches[self.__dict__[arg].name] = arg
+            if self.__dict__[arg].short:
+                self.ShortSwitches.setdefault(self.__dict__[arg].short, arg)
 
 
     def rc(self):
-        """Runtime configuration (parse *argv*)"""
+        """Runtime configuration (parse *argv*).
+
+        The *argv* is walked once (expanding any `@path` response files when
+        *response_files* is set) by *scan*, and the free arguments are handed
+        out by *assign* (see both). The outcome is then stored on the member
+        Arguments.
+        """
 
         self.register()
 
         if not self.argv:
             raise Usage(self.usage_statement())
 
-        # identify the switches and flags
-        for i, arg in enumerate(self.argv):
-            if arg[0] == "-":
-                if len(arg) < 2:
-                    raise Error("'-' is not a recognized flag or switch!")
+        # response files are expanded as they are consumed, not stored in argv
+        tokens = self.argv
+        if self.response_files:
+            from .Response import expand
+            tokens = expand(self.argv)
 
-                self.interpret(i, arg[1:])
-            else:
-                self.Remainder[i] = arg
+        given, switches, self.Remainder = self.scan(tokens)
+        for name in given:
+            self.Registry[name].given = True
 
         if self.help.given:
-            raise Usage(self.help_statement())
+            raise Usage(Message(self.help_pieces()))
 
         for flag in self.AllTerminators:
             if self.__dict__[flag].given:
-                raise Usage(self.__dict__[flag].information)
+                raise Usage(self.__dict__[flag].message())
+
+        for name, value in self.assign(given, switches, self.Remainder).items():
+            self.Registry[name].value = value
+
+
+    def scan(self, tokens):
+        """Walk the *tokens* once: flags are noted, each switch is paired with
+        the free argument that follows it, and the remaining free arguments are
+        collected in order. No member is changed, so a registered application
+        may scan concurrently (see CLI.parse).
+
+        Returns the set of flags and switches given, the switches as a list of
+        (switch, value, found) and the list of free arguments.
+        """
+
+        given    = set()
+        switches = []
+        free     = []
+        pending  = None
+        for arg in tokens:
+            if arg[:1] == "-" and arg != "-":
+                if pending is not None:
+                    switches.append((pending, None, arg))
+
+                pending = self.interpret(arg[1:], given)
+
+            elif pending is not None:
+                switches.append((pending, arg, None))
+                pending = None
+
+            else:
+                # a lone `-` is a free argument (conventionally, stdin)
+                free.append(arg)
+
+        if pending is not None:
+            switches.append((pending, None, None))
+
+        return given, switches, free
+
+
+    def assign(self, given, switches, free):
+        """Coerce the values of the *switches* and hand out the *free* arguments
+        (from *scan*) to the Required, Default and List arguments with a cursor.
+        The List receives the tail of the same list (trimmed in place), so the
+        whole parse is O(n) in the length of *argv*.
+
+        Returns a dictionary of the new values by member name; the flags *given*
+        are True. No member is changed.
+        """
+
+        values = {}
 
         # walk the switches and assign values
-        for i, switch in self.GivenSwitches.items():
+        for switch, value, found in switches:
 
-            if i + 1 not in self.Remainder:
-                if len(self.argv) <= i + 1:
+            if value is None:
+                if found is None:
                     raise Error("--{} expected a free argument to follow but there were "
                             "none left!".format(switch))
                 else:
                     raise Error("--{} expected a free argument to follow but found "
-                            "`{}` instead!".format(switch, self.argv[i+1]))
+                            "`{}` instead!".format(switch, found))
+
+            values[switch] = self.Registry[switch].coerce(value)
 
-            self.__dict__[switch].set(self.Remainder[i+1])
-            del(self.Remainder[i+1])
+        # the remaining names given are flags
+        for name in given:
+            values.setdefault(name, True)
 
-        if len(self.Remainder) < len(self.AllRequired):
+        count = len(free)
+        if count < len(self.AllRequired):
             raise Error("Insufficient arguments given: {} have not been provided."
                 .format(", ".join(['`{}`'.format(arg) for arg in
-                self.AllRequired[len(self.AllRequired) - len(self.Remainder):]])))
+                self.AllRequired[len(self.AllRequired) - count:]])))
 
-        self.Remainder = list(self.Remainder.values())
-
-        # assign the Required arguments and pop them off the list
+        # assign the Required arguments in order
+        cursor = 0
         for arg in self.AllRequired:
-            self.__dict__[arg].set(self.Remainder[0])
-            del(self.Remainder[0])
+            values[arg] = self.Registry[arg].coerce(free[cursor])
+            cursor += 1
 
-        if len(self.Remainder) > len(self.AllDefaults) and len(self.AllLists) == 0:
+        if count - cursor > len(self.AllDefaults) and len(self.AllLists) == 0:
             raise Error("Too many arguments given! Only {} default arguments available "
-                    "but {} given.".format(len(self.AllDefaults), len(self.Remainder)))
+                    "but {} given.".format(len(self.AllDefaults), count - cursor))
 
-        # assign the Default arguments and pop them off the list
+        # assign the Default arguments in order
         for arg in self.AllDefaults:
-            if len(self.Remainder) > 0:
-                self.__dict__[arg].set(self.Remainder[0])
-                del(self.Remainder[0])
+            if cursor < count:
+                values[arg] = self.Registry[arg].coerce(free[cursor])
+                cursor += 1
 
-        if len(self.Remainder) == 0 and len(self.AllLists) == 0:
-            return
+        # drop the assigned arguments in place; what remains is for the List
+        del(free[:cursor])
 
-        if len(self.Remainder) > 0 and len(self.AllLists) == 0:
-            raise Error("There were {} too many arguments!".format(len(self.Remainder)))
+        if len(free) == 0 and len(self.AllLists) == 0:
+            return values
 
-        if len(self.Remainder) == 0 and len(self.AllLists) > 0:
+        if len(free) > 0 and len(self.AllLists) == 0:
+            raise Error("There were {} too many arguments!".format(len(free)))
+
+        if len(free) == 0 and len(self.AllLists) > 0:
             raise Error("Expected at least one argument for `{}`!".format(self.AllLists[0]))
 
         # pass the remaining argument to the list
-        self.__dict__[self.AllLists[0]].set(self.Remainder)
+        values[self.AllLists[0]] = self.Registry[self.AllLists[0]].coerce(free)
+        return values
 
 
-    def interpret(self, index, option):
-        """Interpret Flags, Switches passed from *argv*."""
+    def interpret(self, option, given):
+        """Interpret Flags, Switches passed from *argv*, adding their names to the
+        set of those *given*. Returns the name of the switch named by *option*
+        (which expects a value to follow), or None.
+        """
 
         if (option[0] == '-'):
 
             if len(option) < 2:
                 raise Error("'--' is not a recognized flag or switch!")
 
-            self.long_form(index, option[1:])
+            return self.long_form(option[1:], given)
 
         else:
-            self.short_form(index, option)
+            return self.short_form(option, given)
 
 
 
-    def short_form(self, index, option):
+    def short_form(self, option, given):
         """Interpret a short form flag argument."""
 
         if len(option) > 1:
             # allow for stacked flags
             for flag in option[1:]:
-                if not self.set_flag(flag):
+                if not self.set_flag(flag, given):
                     raise Error("`{}` does not name a flag!".format(flag))
 
-        elif not self.set_flag(option):
-            if not self.set_switch(index, option):
-                raise Error("`{}` does not name a flag or switch!".format(option))
+            return None
 
+        if self.set_flag(option, given):
+            return None
 
+        switch = self.set_switch(option, given)
+        if switch is None:
+            raise Error("`{}` does not name a flag or switch!".format(option))
+
+        return switch
 
-    def set_flag(self, option):
-        """Attempt to set a flag, return False on failure."""
 
-        found = False
-        for flag in self.AllFlags:
-            if self.__dict__[flag].short and self.__dict__[flag].short == option:
 
-                if self.__dict__[flag].given:
-                    raise Error("The `{}` flag was already given!".format(flag))
+    def set_flag(self, option, given):
+        """Attempt to set a flag, return False on failure."""
 
-                self.__dict__[flag].value = True
-                self.__dict__[flag].given = True
-                found = True
-                break
+        flag = self.ShortFlags.get(option)
+        if flag is None:
+            return False
 
-        return found
+        if flag in given:
+            raise Error("The `{}` flag was already given!".format(flag))
 
+        given.add(flag)
+        return True
 
 
-    def set_switch(self, index, option):
-        """Attempt to set a switch, return False on failure."""
 
-        found = False
-        for switch in self.AllSwitches:
-            if self.__dict__[switch].short and self.__dict__[switch].short == option:
+    def set_switch(self, option, given):
+        """Attempt to set a switch, return its name (or None on failure)."""
 
-                if self.dict__[switch].given:
-                    raise Error("The `{}` switch was already given!".format(switch))
+        switch = self.ShortSwitches.get(option)
+        if switch is None:
+            return None
 
-                self.GivenSwitches[index] = switch
-                self.__dict__[switch].given = True
-                found = True
-                break
+        if switch in given:
+            raise Error("The `{}` switch was already given!".format(switch))
 
-        return found
+        given.add(switch)
+        return switch
 
 
 
-    def long_form(self, index, option):
-        """Set an argument given it's long form name."""
+    def long_form(self, option, given):
+        """Set an argument given it's long form name; return its name if it is a
+        switch, otherwise None.
+        """
 
         # attempt to assign a flag first
-        for arg in self.__dict__:
-            if (issubclass(type(self.__dict__[arg]), Argument) and
-                    self.__dict__[arg].name == option):
+        arg = self.LongFlags.get(option)
+        if arg is not None:
+
+            if arg in given:
+                raise Error("The `{}` flag was already given!".format(option))
+
+            given.add(arg)
+            return None
+
+        arg = self.LongSwitches.get(option)
+        if arg is not None:
+
+            if arg in given:
+                raise Error("The `{}` switch was already given!".format(arg))
+
+            given.add(arg)
+            return arg
+
+        raise Error("--{} does not name a flag or switch!{}".format(option,
+            hint(self.suggestions(option))))
 
-                if isinstance(self.__dict__[arg], Flag):
 
-                    if self.__dict__[arg].given:
-                        raise Error("The `{}` flag was already given!".format(option))
+    def suggestions(self, option):
+        """The long names closest to an unknown *option* (see CLI.Suggestions)."""
 
-                    self.__dict__[arg].set(True)
-                    self.__dict__[arg].given = True
-                    return
+        names = tuple(self.LongFlags) + tuple(self.LongSwitches)
+        if self.Spec is None:
+            return Suggestions(names).suggest(option)
 
-                elif isinstance(self.__dict__[arg], Switch):
+        return self.Spec.suggestions("options", names, option)
 
-                    if self.__dict__[arg].given:
-                        raise Error("The `{}` switch was already given!".format(arg))
 
-                    self.GivenSwitches[index] = arg
-                    self.__dict__[arg].given = True
-                    return
 
-        raise Error("--{} does not name a flag or switch!".format(option))
+    def usage_statement(self, name=None):
+        """Display a usage statement for the application, as *name* (by default
+        the program name from *argv*).
+        """
+
+        return "usage: {}{}".format(name or self.name, self.rendered()[0])
+
+
+    def help_statement(self, name=None):
+        """Show help information for this application (called with -h | --help)."""
+        return "".join(self.help_pieces(name))
+
+
+    def help_pieces(self, name=None):
+        """Yield the help statement in pieces as it is rendered, so it can be written
+        out without first building the whole text (see CLI.Writer).
+        """
+
+        yield "usage: {}".format(name or self.name)
+
+        if self.Spec is None:
+            yield from self.usage_parts()
+            yield from self.help_parts()
+        else:
+            yield from self.Spec.stream(self, self.render_key, self.usage_parts,
+                    self.help_parts)
+
+        if self.info:
+            yield "\n{}".format(self.info)
+
+
+    def rendered(self):
+        """The usage statement (following the program name) and the help for each
+        Argument. These are rendered once per class and memoized in its Spec.
+        """
+
+        if self.Spec is None:
+            return self.render()
+
+        return self.Spec.text(self, self.render_key, self.render)
+
+
+    def render_key(self):
+        """The parts of the rendered text that may differ between instances."""
+
+        return repr([self.__doc__] + [(arg.name, arg.description, arg.shown_default())
+            for arg in self.Registry.values()])
 
 
+    def render(self):
+        """Render the usage statement and help (see *rendered*)."""
 
-    def usage_statement(self):
-        """Display a usage statement for the application."""
+        return self.usage_body(), self.help_body()
 
-        message = "usage: {}".format(self.name)
+
+    def usage_body(self):
+        """Render the usage statement following the program name."""
+        return "".join(self.usage_parts())
+
+
+    def usage_parts(self):
+        """Yield the pieces of the usage statement (see *usage_body*)."""
 
         for arg in self.AllRequired:
-            message += " {}".format(arg)
+            yield " {}".format(self.__dict__[arg].name)
 
         for arg in self.AllDefaults:
-            message += " [{} {}]".format(arg, self.__dict__[arg].default)
+            yield " [{} {}]".format(self.__dict__[arg].name, self.__dict__[arg].shown_default())
 
         for arg in self.AllLists:
-            message += " {0}1 [{0}2 ...]".format(arg)
+            yield " {0}1 [{0}2 ...]".format(self.__dict__[arg].name)
 
         for arg in self.AllSwitches + self.AllFlags:
             if self.__dict__[arg].short:
-                message += " [-{} | --{} {}]".format(self.__dict__[arg].short, arg,
-                        self.__dict__[arg].default)
+                yield " [-{} | --{} {}]".format(self.__dict__[arg].short, self.__dict__[arg].name,
+                        self.__dict__[arg].shown_default())
             else:
-                message += " [--{} {}]".format(arg, self.__dict__[arg].default)
+                yield " [--{} {}]".format(self.__dict__[arg].name,
+                        self.__dict__[arg].shown_default())
 
         doc_lines = [line.strip() for line in self.__doc__.split("\n")]
         if not doc_lines[-1]:
             # on multiline docstrings the last line is empty
             del(doc_lines[-1])
 
-        return "{}\n\n{}".format(message, "\n".join(doc_lines))
+        yield "\n\n{}".format("\n".join(doc_lines))
 
 
-    def help_statement(self):
-        """Show help information for this application (called with -h | --help)."""
+    def help_body(self):
+        """Render the help for each Argument (following the usage statement)."""
+        return "".join(self.help_parts())
 
-        spacing = 0
-        for names in self.Registry:
-            if len(names) > spacing:
-                spacing = len(names)
 
-        spacing += 10
-        message  = self.usage_statement()
+    def help_parts(self):
+        """Yield the help for each Argument in turn (see *help_body*)."""
 
-        for arg in self.AllRequired:
-            message += self.__dict__[arg].help(spacing)
+        spacing = 0
+        for arg in self.Registry.values():
+            if len(arg.name) > spacing:
+                spacing = len(arg.name)
 
-        for arg in self.AllDefaults:
-            message += self.__dict__[arg].help(spacing)
+        spacing += 10
 
-        for arg in self.AllLists:
-            message += self.__dict__[arg].help(spacing)
+        for arg in self.AllRequired + self.AllDefaults + self.AllLists:
+            yield self.__dict__[arg].help(spacing)
 
         # additional spacing seperates nameless arguments from switches/flags
-        message += "\n"
-
-        for arg in self.AllSwitches:
-            message += self.__dict__[arg].help(spacing)
+        yield "\n"
 
-        for arg in self.AllFlags:
-            message += self.__dict__[arg].help(spacing)
+        for arg in self.AllSwitches + self.AllFlags:
+            yield self.__dict__[arg].help(spacing)
 
-        if self.info:
-            message += "\n{}".format(self.info)
 
-        return message
+    def main(self):
+        """*main* must be redefined for a SingleMode application, unless it has a
+        *fan_out*, in which case *each* is run over the items of the List.
+        """
 
+        if self.fan_out:
+            from .FanOut import fan_out
+            return fan_out(self, self.Registry[self.AllLists[0]].value, self.fan_out,
+                    self.Registry["jobs"].value, self.chunksize)
 
-    def main(self):
-        """*main* must be redefined for a SingleMode application!"""
         raise Error("*main* must be redefined for a SingleMode application!")
 
 
-    def Exe(self, reassign=True, exceptions=False):
+    def each(self, item):
+        """*each* must be redefined for an application with a *fan_out*! It is
+        given one item of the List and returns an exit status.
+        """
+        raise Error("*each* must be redefined for an application with a *fan_out*!")
+
+
+    def Exe(self, reassign=True, exceptions=False, intercept=True):
         """Parse the *argv* and run *main*.
 
         reassign: bool
@@ -356,26 +579,59 @@ class SingleMode(object):
 
         exceptions: bool
             If True, re-raise the CLI.Error when caught.
+
+        intercept: bool
+            Accepted as for the MultiMode (a SingleMode has no `--batch` or
+            `shell` to intercept).
+        """
+
+        try:
+            self.prepare(reassign)
+
+            status = self.main()
+            if status is not None and not isinstance(status, int):
+                from collections.abc import Coroutine
+                if isinstance(status, Coroutine):
+                    # an `async def main`
+                    from .Runner import run
+                    status = run(status, self.uvloop)
+
+            return status
+
+        except (Usage, Error) as error:
+            return handle(error, self.pager, exceptions)
+
+
+    async def ExeAsync(self, reassign=True, exceptions=False, intercept=True):
+        """As *Exe*, but await an `async def main` on the running event loop, so
+        that several applications can run concurrently (see CLI.Batch).
         """
 
+        from collections.abc import Coroutine
+
         try:
-            self.rc()
+            self.prepare(reassign)
+
+            status = self.main()
+            if isinstance(status, Coroutine):
+                status = await status
 
-            if reassign:
-                for name, arg in self.__dict__.items():
-                    if issubclass(type(arg), Argument):
-                        self.__dict__[name] = arg.value
+            return status
 
-            return self.main()
+        except (Usage, Error) as error:
+            return handle(error, self.pager, exceptions)
 
-        except Usage as usage:
-            print(usage)
-            return 0
 
-        except Error as err:
+    def prepare(self, reassign=True):
+        """Parse the *argv* and, if *reassign*, replace the member Arguments with
+        their *value*. The Deferred value of a *lazy* Argument is resolved when
+        the member is first used (see CLI.Deferred).
+        """
 
-            if exceptions:
-                raise
+        self.rc()
 
-            print(err)
-            return 1
+        if reassign:
+            for name, arg in self.Registry.items():
+                if isinstance(arg.value, Deferred):
+                    Resolve.install(type(self), name)
+                self.__dict__[name] = arg.value
@@ -0,0 +1,250 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Spec.py
+
+"""Implementation of Spec(object)."""
+
+import os
+
+from .Trie import Trie
+from .Suggestions import Suggestions
+
+
+class Spec(object):
+    """
+    A Spec is the *compiled* result of registering an application's member
+    Arguments. It is computed once per class, after the first successful call
+    to *register*, and applied to every later instance of that class so the
+    validation pass is not repeated.
+    """
+
+    # compiled specs for each application class, see *key*
+    Compiled = {}
+
+    def __init__(self, signature, tables, names=None, usage=None, help=None, frozen=False,
+            members=None, sources=None, commands=None):
+        """Initialize the new Spec.
+
+        signature: tuple
+            The *signature* of the registered Arguments (see Spec.signature_of).
+            Later instances must match it for the Spec to apply.
+
+        tables: dict
+            The members to attach to each instance (e.g., *AllFlags*,
+            *ShortFlags*). These are shared and must be treated as read-only.
+
+        names: tuple
+            The member names of the registered Arguments, in order. Taken from
+            the *signature* when not given.
+
+        usage: str or tuple
+            The pre-rendered usage statement following the program name (see
+            *usage_statement* for the SingleMode and MultiMode).
+
+        help: str
+            The pre-rendered help following the usage statement.
+
+        frozen: bool
+            A frozen Spec was generated ahead of time (see CLI.Freeze) and is
+            trusted without checking its *signature*, so long as it is *current*.
+
+        members: tuple
+            For a frozen Spec, the names of all the members of an instance
+            before it is registered (see *current*).
+
+        sources: tuple
+            For a frozen Spec, the (path, mtime) of each source file the class
+            was defined in (see *current*).
+
+        commands: tuple
+            For a MultiMode, the names of its SubCommands. A later instance with
+            other names does not match the Spec (see MultiMode.register), so the
+            Trie over them is built once (see *trie*).
+        """
+
+        self.signature = signature
+        self.tables    = tables
+        self.names     = names if names is not None else tuple(s[0] for s in signature)
+        self.frozen    = frozen
+        self.members   = members
+        self.sources   = sources
+        self.commands  = commands
+
+        # (key, usage, help) for the rendered text, see *text*
+        self.rendered  = None if usage is None else (None, usage, help)
+
+        # the (names, index) built over names of each kind, see *index*
+        self.indexes   = {}
+
+
+    @staticmethod
+    def key(cls):
+        """The `module:Class` key used to look up the Spec for *cls*."""
+        return "{}:{}".format(cls.__module__, cls.__qualname__)
+
+
+    @staticmethod
+    def signature_of(registry):
+        """Compute the signature of a *registry* of member Arguments. Anything the
+        validation and lookup tables depend on is part of the signature.
+        """
+        return tuple((name, type(arg), arg.name, arg.short, type(arg.default))
+                for name, arg in registry.items())
+
+
+    @classmethod
+    def lookup(cls, app_type):
+        """Return the compiled Spec for the application class, or None."""
+        return cls.Compiled.get(cls.key(app_type))
+
+
+    @classmethod
+    def install(cls, app_type, spec):
+        """Store the compiled *spec* for the application class."""
+        cls.Compiled[cls.key(app_type)] = spec
+
+
+    @classmethod
+    def compile(cls, app, signature, tables, commands=None):
+        """Build a Spec from an *app* that has just been registered. The
+        *signature* must be computed before the implicit names were attached.
+        """
+        return cls(signature, {name: app.__dict__[name] for name in tables}, commands=commands)
+
+
+    @classmethod
+    def freeze(cls, key, names, tables, usage, help, commands=None, members=None,
+            sources=None):
+        """Install a frozen Spec under the `module:Class` *key*. This is called by
+        the modules generated with CLI.Freeze and does not import the class.
+        """
+        cls.Compiled[key] = cls(None, tables, names=names, usage=usage, help=help, frozen=True,
+                members=members, sources=sources, commands=commands)
+
+
+    def current(self, app):
+        """Whether a frozen Spec still describes the *app*, which has not yet been
+        registered. The *sources* must not have changed since the Spec was
+        generated (they are checked once), and the *app* must have the same
+        *members*. Otherwise, the *app* is registered as usual and the Spec
+        compiled from it replaces this one.
+        """
+
+        if self.sources is not None:
+            for path, mtime in self.sources:
+                try:
+                    changed = os.stat(path).st_mtime_ns != mtime
+                except OSError:
+                    changed = True
+
+                if changed:
+                    self.frozen = False
+                    return False
+
+            self.sources = None
+
+        return self.members is None or tuple(app.__dict__) == self.members
+
+
+    def text(self, app, key, render):
+        """Return the (usage, help) text for an *app*. The text is only rendered
+        (by calling *render*) the first time, or again if *key()* has changed
+        since; the on-disk Cache is consulted before rendering (see CLI.Cache).
+        A frozen Spec always returns its pre-rendered text.
+        """
+
+        key, text = self.recall(app, key)
+        if text is None:
+            text = render()
+            self.remember(app, key, text)
+
+        return text
+
+
+    def stream(self, app, key, usage, help):
+        """As *text*, but yield the usage and then the help text in pieces. If the
+        text must be rendered, the pieces are yielded from the generators *usage()*
+        and *help()* as they come, and remembered only once all of them were.
+        """
+
+        key, text = self.recall(app, key)
+        if text is not None:
+            yield text[0]
+            yield text[1]
+            return
+
+        pieces = [[], []]
+        for index, parts in enumerate((usage, help)):
+            for piece in parts():
+                pieces[index].append(piece)
+                yield piece
+
+        self.remember(app, key, ("".join(pieces[0]), "".join(pieces[1])))
+
+
+    def recall(self, app, key):
+        """Return *key()* and the (usage, help) text remembered for it, or None."""
+
+        rendered = self.rendered
+        if rendered is not None and self.frozen:
+            return None, rendered[1:]
+
+        key = key()
+        if rendered is not None and rendered[0] == key:
+            return key, rendered[1:]
+
+        from . import Cache
+        text = Cache.load(type(app), "text", key)
+        if text is None:
+            return key, None
+
+        self.rendered = (key, text[0], text[1])
+        return key, self.rendered[1:]
+
+
+    def remember(self, app, key, text):
+        """Keep the rendered (usage, help) *text* for the *key*."""
+
+        from . import Cache
+        Cache.store(type(app), "text", key, text)
+        self.rendered = (key, text[0], text[1])
+
+
+    def index(self, kind, names, build):
+        """Return the index of a *kind* (e.g., "trie") over the *names* (a tuple)
+        made by calling *build(names)*. It is built only the first time, or again
+        if the *names* have changed since (the same tuple is not compared).
+        """
+
+        entry = self.indexes.get(kind)
+        if entry is None or (entry[0] is not names and entry[0] != names):
+            entry = self.indexes[kind] = (names, build(names))
+
+        return entry[1]
+
+
+    def trie(self, commands):
+        """Return the Trie of the SubCommands (see CLI.Trie). If the names of the
+        *commands* were fixed when the Spec was compiled, they are not looked at
+        again; otherwise (e.g., a Spec frozen without them) they are indexed.
+        """
+        names = self.commands if self.commands is not None else tuple(commands)
+        return self.index("trie", names, Trie)
+
+
+    def suggestions(self, kind, names, word):
+        """Return the *names* of a *kind* (e.g., "options") closest to an unknown
+        *word*. The index is only built at the first unknown word.
+        """
+        return self.index(kind, names, Suggestions).suggest(word)
+
+
+    def apply(self, app):
+        """Attach the compiled tables and implicit names to an *app*."""
+
+        for name, arg in app.Registry.items():
+            if not arg.name:
+                arg.name = name
+
+        app.__dict__.update(self.tables)
+        app.Spec = self
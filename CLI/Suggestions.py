@@ -0,0 +1,96 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Suggestions.py
+
+"""Implementation of Suggestions(object), used to suggest corrections for typos."""
+
+
+def distance(a, b, limit):
+    """The edit distance between the strings *a* and *b*, counting insertions,
+    deletions, substitutions and transpositions of adjacent characters. Once it
+    is certain to exceed *limit*, `limit + 1` is returned instead.
+    """
+
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    before   = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i]
+        for j in range(1, len(b) + 1):
+            cost = previous[j - 1] + (a[i - 1] != b[j - 1])
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+
+        if min(current) > limit:
+            return limit + 1
+
+        before, previous = previous, current
+
+    return min(previous[-1], limit + 1)
+
+
+def grams(word):
+    """The set of bigrams of the *word*, padded to mark its start and end."""
+
+    padded = "^{}$".format(word)
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def hint(suggestions):
+    """Format the *suggestions* to follow an error message ("" if none)."""
+
+    if not suggestions:
+        return ""
+
+    return " Did you mean {}?".format(" or ".join("`{}`".format(name)
+        for name in suggestions))
+
+
+class Suggestions(object):
+    """
+    An index of names by their bigrams, to find those within a few edits of an
+    unknown word. Each edit changes at most three of the word's bigrams, so only
+    the names sharing enough bigrams with it are candidates; the edit *distance*
+    is computed for these few alone, rather than for every name.
+    """
+
+    __slots__ = ("names", "postings")
+
+    def __init__(self, names):
+        """Index the *names*."""
+
+        self.names    = list(dict.fromkeys(names))
+        self.postings = {}
+        for index, name in enumerate(self.names):
+            for gram in grams(name):
+                self.postings.setdefault(gram, []).append(index)
+
+
+    def suggest(self, word, count=3):
+        """Return up to *count* names close enough to *word* to be likely typos
+        of it, nearest first: one edit away for short words, up to two for
+        longer ones.
+        """
+
+        radius = max(1, min(2, len(word) // 3))
+
+        wanted = grams(word)
+        shared = {}
+        for gram in wanted:
+            for index in self.postings.get(gram, ()):
+                shared[index] = shared.get(index, 0) + 1
+
+        threshold = max(1, len(wanted) - 3 * radius)
+
+        found = []
+        for index, common in shared.items():
+            if common >= threshold:
+                d = distance(word, self.names[index], radius)
+                if d <= radius:
+                    found.append((d, self.names[index]))
+
+        return [name for d, name in sorted(found)[:count]]
@@ -13,16 +13,20 @@ class Switch(Argument):
     **must** follow the flag on the command line.
     """
 
-    def __init__(self, description, default, short=None, name=None):
+    __slots__ = ()
+
+    def __init__(self, description, default, short=None, name=None, lazy=False, dtype=None,
+            check=None):
         """Initialize the new Switch(Argument)."""
-        super(Switch, self).__init__(description, default=default, short=short, name=name)
+        super(Switch, self).__init__(description, default=default, short=short, name=name,
+                lazy=lazy, dtype=dtype, check=check)
 
 
     def help(self, spacing = 10):
         """Return the *help* string for this *Argument*."""
         if not self.short:
             return " --{}{}{} (default: {}).\n".format(self.name, " " *
-                    (spacing - len(self.name) - 2), self.description, self.default)
+                    (spacing - len(self.name) - 2), self.description, self.shown_default())
         else:
             return " -{}, --{}{}{} (default: {}).\n".format(self.short, self.name,
-                    " " * (spacing - len(self.name) - 6), self.description, self.default)
+                    " " * (spacing - len(self.name) - 6), self.description, self.shown_default())
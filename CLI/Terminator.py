@@ -6,14 +6,18 @@
 
 from .Argument   import Argument
 from .Exceptions import Error
+from .Deferred   import evaluate
 
 class Terminator(Argument):
     """
     A Terminator *Argument* is a Flag that will stop the execution
     but display some requested information about the program (e.g.,
-    --copyright).
+    --copyright). The *information* may be a callable, called only when the
+    Terminator is given (once per process, see CLI.Deferred).
     """
 
+    __slots__ = ("information",)
+
     def __init__(self, description, information, short=None, name=None):
         """Initialize the new Terminator(Argument)."""
         super(Terminator, self).__init__(description, default=False, short=short, name=name)
@@ -30,6 +34,14 @@ class Terminator(Argument):
                     " " * (spacing - len(self.name) - 6), self.description, self.default)
 
 
+    def message(self):
+        """The *information* to display when the Terminator is given."""
+        if callable(self.information):
+            return evaluate(self.information)
+
+        return self.information
+
+
     def set(self, value):
         """Specialized method for setting the *value* of the Flag."""
         if type(value) is bool:
@@ -0,0 +1,98 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Trie.py
+
+"""Implementation of Trie(object)."""
+
+
+class Node(object):
+    """A node of the Trie: the *names* below it are counted, and kept if unique."""
+
+    __slots__ = ("children", "name", "count", "unique")
+
+    def __init__(self):
+        self.children = {}
+        self.name     = None   # the name ending at this node
+        self.count    = 0      # the number of names at or below this node
+        self.unique   = None   # the name, if *count* is one
+
+
+class Trie(object):
+    """
+    A prefix tree of (subcommand) names. A name is found by any prefix of it
+    that no other name shares, in time proportional to the length of the prefix
+    rather than the number of names.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, names):
+        """Build the Trie from an iterable of *names*."""
+
+        self.root = Node()
+        for name in names:
+            self.insert(name)
+
+
+    def insert(self, name):
+        """Add a *name* to the Trie (once)."""
+
+        node = self.find(name)
+        if node is not None and node.name is not None:
+            return
+
+        node = self.root
+        path = [node]
+        for char in name:
+            node = node.children.setdefault(char, Node())
+            path.append(node)
+
+        node.name = name
+        for node in path:
+            node.count += 1
+            node.unique = name if node.count == 1 else None
+
+
+    def find(self, prefix):
+        """Return the Node reached by the *prefix*, or None."""
+
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+
+        return node
+
+
+    def match(self, prefix):
+        """Return the list of names the *prefix* could mean: the one name equal to
+        it or uniquely starting with it, otherwise all those starting with it
+        (none if it matches nothing).
+        """
+
+        node = self.find(prefix)
+        if node is None:
+            return []
+
+        if node.name is not None:
+            return [node.name]
+
+        if node.unique is not None:
+            return [node.unique]
+
+        return self.below(node)
+
+
+    def below(self, node):
+        """All the names at or below a *node*, in sorted order."""
+
+        names = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.name is not None:
+                names.append(node.name)
+            stack.extend(node.children.values())
+
+        return sorted(names)
@@ -0,0 +1,201 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# CLI/Writer.py
+
+"""Write usage and help text out as it is rendered.
+
+The text is written piece by piece (see *help_pieces* for the SingleMode and
+MultiMode), wrapped to the width of the terminal if there is one, optionally
+through the `$PAGER`. Output stops quietly when the reader goes away (e.g.,
+`app -h | head`).
+"""
+
+import os
+import re
+import sys
+from collections.abc import Iterator
+
+from .Exceptions import Message
+
+
+# the column following the name in a line of help (e.g., ` -v, --verbose   show ...`)
+Column = re.compile(r"\S {2,}")
+
+
+def hanging(line, width):
+    """The indentation for the continuation of a wrapped *line*: under the first
+    argument for the usage statement, under the description for the help of an
+    Argument, otherwise that of the line itself.
+    """
+
+    if line.startswith("usage: "):
+        indent = line.find(" ", 7) + 1
+    else:
+        match  = Column.search(line)
+        indent = len(line) - len(line.lstrip(" "))
+        if match and indent:
+            indent = match.end()
+
+    return min(indent, width // 2)
+
+
+class Writer(object):
+    """Writes text to a *stream*, wrapping the lines longer than *width* at the
+    spaces (not at all if *width* is None). At most one line is held back.
+    """
+
+    def __init__(self, stream, width=None):
+        """Write to the *stream* (e.g., sys.stdout)."""
+
+        self.stream = stream
+        self.width  = width
+        self.line   = ""     # the part of the current line not yet written
+        self.indent = None   # the hanging indentation of the current line
+        self.usage  = False  # whether the current line is a usage statement
+
+
+    def write(self, text):
+        """Write (or hold back) the *text*."""
+
+        if not self.width:
+            self.stream.write(text)
+            return
+
+        for index, piece in enumerate(text.split("\n")):
+            if index:
+                self.stream.write(self.line + "\n")
+                self.line, self.indent = "", None
+
+            self.line += piece
+            while len(self.line) > self.width and self.wrap():
+                pass
+
+
+    def wrap(self):
+        """Write out one row of the current line; False if it cannot be broken yet."""
+
+        if self.indent is None:
+            self.indent = hanging(self.line, self.width)
+            self.usage  = self.line.startswith("usage: ")
+
+        cut = -1
+        if self.usage:
+            # keep each `[-x | --name value]` together
+            cut = self.line.rfind(" [", self.indent + 1, self.width + 1)
+
+        if cut == -1:
+            cut = self.line.rfind(" ", self.indent + 1, self.width + 1)
+
+        if cut == -1:
+            # a word longer than the row; break after it
+            cut = self.line.find(" ", self.width + 1)
+            if cut == -1:
+                return False
+
+        self.stream.write(self.line[:cut].rstrip() + "\n")
+        self.line = " " * self.indent + self.line[cut:].lstrip(" ")
+        return True
+
+
+    def close(self):
+        """Write out anything held back and flush the *stream*."""
+
+        self.stream.write(self.line)
+        self.line = ""
+        self.stream.flush()
+
+
+def width(stream):
+    """The width of the terminal behind the *stream*, or None if it is not one."""
+
+    try:
+        if not stream.isatty():
+            return None
+
+        columns = int(os.environ.get("COLUMNS", 0))
+        if not columns:
+            columns = os.get_terminal_size(stream.fileno()).columns
+
+        return columns - 1 if columns > 1 else None
+
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def display(message, pager=False):
+    """Write the *message* to stdout, followed by a newline (as *print* would).
+    The *message* may be an iterator of pieces of text (or a Message), written
+    as they come. If *pager* is True and stdout is a terminal, it is shown
+    through `$PAGER`.
+    """
+
+    pieces = message if isinstance(message, (Iterator, Message)) else [str(message)]
+
+    command = os.environ.get("PAGER") if pager and width(sys.stdout) else None
+    if command and page(pieces, command):
+        return
+
+    writer = Writer(sys.stdout, width(sys.stdout))
+    try:
+        for piece in pieces:
+            writer.write(piece)
+
+        writer.write("\n")
+        writer.close()
+
+    except BrokenPipeError:
+        silence(sys.stdout)
+
+
+def page(pieces, command):
+    """Write the *pieces* through the pager *command*; False if it cannot be run."""
+
+    import shlex
+    import subprocess
+
+    sys.stdout.flush()
+    try:
+        process = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE,
+                universal_newlines=True, errors="backslashreplace")
+    except (OSError, ValueError):
+        return False
+
+    writer = Writer(process.stdin, width(sys.stdout))
+    try:
+        for piece in pieces:
+            writer.write(piece)
+
+        writer.write("\n")
+        writer.close()
+
+    except BrokenPipeError:
+        # the pager was quit before the end of the text
+        pass
+
+    try:
+        process.stdin.close()
+    except OSError:
+        pass
+
+    while True:
+        try:
+            process.wait()
+            break
+        except KeyboardInterrupt:
+            # the pager handles ^C itself
+            pass
+
+    return True
+
+
+def silence(stream):
+    """Point the *stream* at /dev/null after its reader went away, so that the
+    interpreter does not report the broken pipe again when it flushes at exit.
+    """
+
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stream.fileno())
+        os.close(devnull)
+    except (AttributeError, ValueError, OSError):
+        pass
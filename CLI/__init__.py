@@ -8,7 +8,7 @@ A Python framework for managing command line argument parsing and
 automatic usage documentation.
 """
 
-from .Exceptions import Error
+from .Exceptions import Error, Usage
 from .Argument   import Argument
 from .Required   import Required
 from .Default    import Default
@@ -19,7 +19,8 @@ from .List       import List
 
 from .SingleMode import SingleMode
 from .MultiMode import MultiMode
+from .Parse      import parse
 
 
-__all__ = [Error, Argument, Required, Default, Switch, Flag, Terminator, List,
-        SingleMode, MultiMode]
+__all__ = [Error, Usage, Argument, Required, Default, Switch, Flag, Terminator, List,
+        SingleMode, MultiMode, parse]
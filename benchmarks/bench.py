@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# benchmarks/bench.py
+
+"""bench.py
+
+Measure the parser throughput and startup time of CLI. Results are saved as
+JSON and can be compared against a stored baseline to flag regressions.
+
+    python benchmarks/bench.py -o baseline.json
+    python benchmarks/bench.py -b baseline.json --threshold 0.25 [--quick]
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import CLI
+
+
+def make_single(nargs):
+    """Generate a SingleMode application with *nargs* Switches and a List."""
+
+    class App(CLI.SingleMode):
+        """Benchmark application."""
+
+        def __init__(self, argv):
+            super(App, self).__init__(argv)
+            for i in range(nargs):
+                setattr(self, "s{}".format(i), CLI.Switch("switch {}".format(i), 0))
+            self.files = CLI.List("files")
+
+        def main(self):
+            return 0
+
+    # each size gets its own Spec
+    App.__qualname__ = "App{}".format(nargs)
+    return App
+
+
+def make_multi(ncommands):
+    """Generate a MultiMode application with *ncommands* subcommands."""
+
+    sub = make_single(5)
+
+    class Multi(CLI.MultiMode):
+        """Benchmark application."""
+
+        def __init__(self, argv):
+            super(Multi, self).__init__(argv)
+            for i in range(ncommands):
+                self.SubCommands["command{}".format(i)] = sub
+
+    Multi.__qualname__ = "Multi{}".format(ncommands)
+    return Multi
+
+
+def measure(func, budget=0.1, repeat=5):
+    """Return the best time of *func* in seconds, over *repeat* rounds of at least
+    *budget* seconds each.
+    """
+
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    number = max(1, int(budget / max(elapsed, 1e-9)))
+    best = elapsed
+    for i in range(repeat):
+        start = time.perf_counter()
+        for j in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+
+    return best
+
+
+def startup(code, repeat=5):
+    """Return the best wall time of a fresh interpreter running *code*, less the
+    time of an interpreter doing nothing.
+    """
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT,
+        os.path.join(ROOT, "examples")]))
+
+    def run(source):
+        best = None
+        for i in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", source], env=env, check=True,
+                    stdout=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    return max(0.0, run(code) - run("pass"))
+
+
+def run_all(quick=False):
+    """Run every benchmark; return a dictionary of name -> seconds."""
+
+    results = {}
+
+    # throughput with the length of argv
+    app = make_single(5)
+    for ntokens in [10, 1000, 100000] if quick else [10, 1000, 100000, 1000000]:
+        argv = ["bench", "--s0", "1", "--s1", "2"] + ["file"] * ntokens
+        results["single.rc.tokens.{}".format(ntokens)] = measure(
+                lambda: app(argv).Exe(), repeat=1 if ntokens > 100000 else 5)
+
+    # throughput with the number of declared arguments
+    for nargs in [5, 50, 500] if quick else [5, 50, 500, 5000]:
+        app  = make_single(nargs)
+        argv = ["bench"]
+        for i in range(0, nargs, 5):
+            argv += ["--s{}".format(i), "1"]
+        argv.append("file")
+
+        app(argv).Exe()  # compile the Spec
+        results["single.rc.arguments.{}".format(nargs)] = measure(lambda: app(argv).Exe())
+        results["single.help.arguments.{}".format(nargs)] = measure(lambda: help_text(app))
+
+    # dispatch with the number of subcommands
+    for ncommands in [10, 100, 1000]:
+        app  = make_multi(ncommands)
+        argv = ["bench", "command{}".format(ncommands - 1), "file"]
+        results["multi.exe.commands.{}".format(ncommands)] = measure(lambda: app(argv).Exe())
+        results["multi.help.commands.{}".format(ncommands)] = measure(lambda: help_text(app))
+
+    # cold start
+    results["import.CLI"]   = startup("import CLI")
+    results["import.hello"] = startup("import hello")
+    results["import.calc"]  = startup("import calc")
+
+    return results
+
+
+def help_text(app):
+    """Render the help text for an application class."""
+
+    instance = app(["bench"])
+    instance.register()
+    return instance.help_statement()
+
+
+def compare(results, baseline, threshold):
+    """Print the comparison of *results* with a *baseline*; return the names of
+    the benchmarks that regressed by more than the *threshold*.
+    """
+
+    regressions = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+
+        ratio = results[name] / baseline[name] if baseline[name] else float("inf")
+        flag  = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+
+        print("{:<36} {:>12.6f} {:>12.6f} {:>8.2f}x{}".format(name, baseline[name],
+            results[name], ratio, flag))
+
+    return regressions
+
+
+class Bench(CLI.SingleMode):
+    """Measure the parser throughput and startup time of CLI."""
+
+    def __init__(self, argv):
+        """Define the arguments for the benchmarks."""
+
+        super(Bench, self).__init__(argv)
+
+        self.output    = CLI.Switch("save the results as JSON to this path", "", "o")
+        self.baseline  = CLI.Switch("compare against the JSON results at this path", "", "b")
+        self.threshold = CLI.Switch("relative slowdown flagged as a regression", 0.25, "t")
+        self.quick     = CLI.Flag("use smaller sizes", False, "q")
+
+
+    def main(self):
+        """Run the benchmarks, then save and compare the results."""
+
+        results = run_all(self.quick)
+
+        report = {"python": platform.python_version(), "platform": platform.platform(),
+                "results": results}
+
+        if self.output:
+            with open(self.output, "w") as stream:
+                json.dump(report, stream, indent=4, sort_keys=True)
+
+        if not self.baseline:
+            for name in sorted(results):
+                print("{:<36} {:>12.6f}".format(name, results[name]))
+            return 0
+
+        with open(self.baseline) as stream:
+            baseline = json.load(stream)["results"]
+
+        regressions = compare(results, baseline, self.threshold)
+        if regressions:
+            print("\n{} benchmark(s) regressed by more than {:.0%}.".format(
+                len(regressions), self.threshold))
+            return 1
+
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit( Bench(sys.argv).Exe() )
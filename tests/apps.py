@@ -0,0 +1,61 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/apps.py
+
+"""The applications and random command lines shared by the parser tests."""
+
+import random
+
+import CLI
+
+
+class A(CLI.SingleMode):
+    """An application with one of each kind of Argument."""
+
+    def __init__(self, argv):
+        super(A, self).__init__(argv)
+        self.r = CLI.Required("r", dtype=int)
+        self.d = CLI.Default("d", 5)
+        self.e = CLI.Default("e", "x")
+        self.s = CLI.Switch("s", 1.0, "s")
+        self.t = CLI.Switch("t", "q", "t")
+        self.f = CLI.Flag("f", False, "f")
+        self.l = CLI.List("l", dtype=str)
+
+
+class B(A):
+    """As A, without the List."""
+
+    def __init__(self, argv):
+        super(B, self).__init__(argv)
+        del self.l
+
+
+# the tokens the command lines are drawn from
+Tokens = ["1", "2", "a", "-s", "-t", "3.5", "-f", "--s", "x", "-", "--nope", "-ff"]
+
+
+def command_lines(count, seed=1):
+    """Yield *count* random command lines (without the program name)."""
+    generator = random.Random(seed)
+    for _ in range(count):
+        yield generator.choices(Tokens, k=generator.randint(0, 7))
+
+
+def outcome(function, *args):
+    """The result of *function(\\*args)*, or the error it raised, for comparison."""
+    try:
+        return "ok", function(*args)
+    except CLI.Usage:
+        return "usage", None
+    except CLI.Error as error:
+        return "error", str(error)
+    except Exception as error:
+        return "raised", repr(error)
+
+
+def by_rc(cls, argv):
+    """Parse with *rc*; the values by member name."""
+    app = cls(["p"] + argv)
+    app.rc()
+    return {name: arg.value for name, arg in app.Registry.items()}
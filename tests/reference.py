@@ -0,0 +1,141 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/reference.py
+
+"""A reference parser for the differential tests (see test_singlemode.py).
+
+This is the index-based `SingleMode.rc()` as it was before the single pass of
+*scan* and *assign*, rewritten as a function so that it reads the registered
+lookup tables of an application without changing it. It is deliberately left
+simple (and slow); only the outcome must agree with the parser in CLI.
+"""
+
+from CLI import Error
+
+
+def reference(app, argv):
+    """Parse the *argv* (without the program name) for the registered *app*.
+    Returns None if there are no arguments, or help or a Terminator was given;
+    otherwise the values of the Arguments by member name. An invalid command
+    line raises a CLI.Error.
+    """
+
+    if not argv:
+        return None
+
+    given     = set()
+    switches  = {}
+    remainder = {}
+    values    = {}
+
+    for index, arg in enumerate(argv):
+        if arg[0] == "-" and arg != "-":
+            interpret(app, index, arg[1:], given, switches, values)
+        else:
+            remainder[index] = arg
+
+    if "help" in given:
+        return None
+
+    for flag in app.AllTerminators:
+        if flag in given:
+            return None
+
+    for index, switch in switches.items():
+        if index + 1 not in remainder:
+            if len(argv) <= index + 1:
+                raise Error("--{} expected a free argument to follow but there were "
+                        "none left!".format(switch))
+            else:
+                raise Error("--{} expected a free argument to follow but found "
+                        "`{}` instead!".format(switch, argv[index + 1]))
+
+        values[switch] = app.Registry[switch].coerce(remainder.pop(index + 1))
+
+    if len(remainder) < len(app.AllRequired):
+        raise Error("Insufficient arguments given: {} have not been provided."
+            .format(", ".join(['`{}`'.format(arg) for arg in
+            app.AllRequired[len(app.AllRequired) - len(remainder):]])))
+
+    remainder = list(remainder.values())
+
+    for arg in app.AllRequired:
+        values[arg] = app.Registry[arg].coerce(remainder.pop(0))
+
+    if len(remainder) > len(app.AllDefaults) and len(app.AllLists) == 0:
+        raise Error("Too many arguments given! Only {} default arguments available "
+                "but {} given.".format(len(app.AllDefaults), len(remainder)))
+
+    for arg in app.AllDefaults:
+        if remainder:
+            values[arg] = app.Registry[arg].coerce(remainder.pop(0))
+
+    if remainder and not app.AllLists:
+        raise Error("There were {} too many arguments!".format(len(remainder)))
+
+    if not remainder and app.AllLists:
+        raise Error("Expected at least one argument for `{}`!".format(app.AllLists[0]))
+
+    if app.AllLists:
+        values[app.AllLists[0]] = app.Registry[app.AllLists[0]].coerce(remainder)
+
+    return {name: values.get(name, arg.value) for name, arg in app.Registry.items()}
+
+
+def interpret(app, index, option, given, switches, values):
+    """Note the flag or switch named by *option* at *index* of the argv."""
+
+    if option[0] == "-":
+        if len(option) < 2:
+            raise Error("'--' is not a recognized flag or switch!")
+
+        name = option[1:]
+        flag = app.LongFlags.get(name)
+        if flag is not None:
+            if flag in given:
+                raise Error("The `{}` flag was already given!".format(name))
+            given.add(flag)
+            values[flag] = True
+            return
+
+        switch = app.LongSwitches.get(name)
+        if switch is not None:
+            if switch in given:
+                raise Error("The `{}` switch was already given!".format(switch))
+            given.add(switch)
+            switches[index] = switch
+            return
+
+        raise Error("--{} does not name a flag or switch!".format(name))
+
+    if len(option) > 1:
+        # stacked flags
+        for char in option[1:]:
+            if not set_flag(app, char, given, values):
+                raise Error("`{}` does not name a flag!".format(char))
+
+    elif not set_flag(app, option, given, values):
+        switch = app.ShortSwitches.get(option)
+        if switch is None:
+            raise Error("`{}` does not name a flag or switch!".format(option))
+
+        if switch in given:
+            raise Error("The `{}` switch was already given!".format(switch))
+
+        given.add(switch)
+        switches[index] = switch
+
+
+def set_flag(app, char, given, values):
+    """Set the flag with the short name *char*; False if there is none."""
+
+    flag = app.ShortFlags.get(char)
+    if flag is None:
+        return False
+
+    if flag in given:
+        raise Error("The `{}` flag was already given!".format(flag))
+
+    given.add(flag)
+    values[flag] = True
+    return True
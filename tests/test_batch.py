@@ -0,0 +1,134 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_batch.py
+
+"""Tests of `--batch`, which runs many command lines in one process (see
+CLI.Batch).
+"""
+
+import re
+import re
+import time
+
+import pytest
+
+import CLI
+from CLI.Batch import Batch
+
+
+def test_usage_shows_option_names(capsys):
+    assert Batch(["app --batch", "-h"]).Exe() == 0
+    usage = capsys.readouterr().out
+    assert "--fail-fast" in usage and "--async" in usage
+    assert "fail_fast" not in usage and "--concurrent" not in usage
+
+
+class Say(CLI.SingleMode):
+    """Print a word and exit with a status."""
+
+    def __init__(self, argv):
+        super(Say, self).__init__(argv)
+        self.word   = CLI.Required("the word")
+        self.status = CLI.Default("the exit status", 0)
+
+    def main(self):
+        print(self.word)
+        return self.status
+
+
+class Nap(CLI.SingleMode):
+    """Sleep, then print a word."""
+
+    def __init__(self, argv):
+        super(Nap, self).__init__(argv)
+        self.word    = CLI.Required("the word")
+        self.seconds = CLI.Default("how long to sleep", 0.0)
+
+    async def main(self):
+        import asyncio
+        await asyncio.sleep(self.seconds)
+        print(self.word)
+
+
+class Tool(CLI.MultiMode):
+    """The application the command lines are run through."""
+
+    def __init__(self, argv):
+        super(Tool, self).__init__(argv)
+        self.SubCommands["say"] = Say
+        self.SubCommands["nap"] = Nap
+
+
+LINES = """\
+say one
+# a comment, and a blank line
+
+say two 3
+say 'three
+say four
+"""
+
+
+def batch(tmp_path, lines, *options):
+    """Run the *lines* through `tool --batch`; return the exit status."""
+    source = tmp_path / "lines.txt"
+    source.write_text(lines)
+    return Batch(["tool --batch", str(source)] + list(options), app=Tool,
+            program="tool").Exe()
+
+
+def reports(error):
+    """The (lineno, status) of each line, as reported on stderr."""
+    return [(int(lineno), int(status))
+            for lineno, status in re.findall(r":(\d+): exit status (-?\d+)", error)]
+
+
+def test_serial(tmp_path, capsys):
+    assert batch(tmp_path, LINES) == 3
+    output, error = capsys.readouterr()
+    assert output == "one\ntwo\nfour\n"
+    assert reports(error) == [(1, 0), (4, 3), (5, 1), (6, 0)]
+    assert "No closing quotation" in error
+
+
+def test_fail_fast(tmp_path, capsys):
+    assert batch(tmp_path, LINES, "--fail-fast") == 3
+    assert capsys.readouterr().out == "one\ntwo\n"
+
+
+@pytest.mark.parametrize("options", [["-j", "2", "-c", "1"], ["-j", "3", "-u"]])
+def test_parallel(tmp_path, capsys, options):
+    assert batch(tmp_path, LINES, *options) == 3
+    output, error = capsys.readouterr()
+    assert sorted(output.split()) == ["four", "one", "two"]
+    assert sorted(reports(error)) == [(1, 0), (4, 3), (5, 1), (6, 0)]
+    if "-u" not in options:
+        assert output == "one\ntwo\nfour\n"
+
+
+def test_async_runs_lines_at_once(tmp_path, capsys):
+    lines = "".join("nap {} {}\n".format(word, 0.3 - 0.1 * index)
+            for index, word in enumerate(["a", "b", "c"]))
+
+    start = time.monotonic()
+    assert batch(tmp_path, lines, "--async") == 0
+    assert time.monotonic() - start < 0.55
+
+    output, error = capsys.readouterr()
+    assert output == "a\nb\nc\n"
+    assert reports(error) == [(1, 0), (2, 0), (3, 0)]
+
+
+def test_async_unordered(tmp_path, capsys):
+    lines = "nap a 0.2\nnap b 0.0\nsay c 2\n"
+    assert batch(tmp_path, lines, "--async", "-u") == 2
+    assert capsys.readouterr().out.split() == ["b", "c", "a"]
+
+
+def test_async_jobs_limits_the_lines_at_once(tmp_path, capsys):
+    lines = "nap a 0.2\nnap b 0.2\nnap c 0.0\n"
+
+    start = time.monotonic()
+    assert batch(tmp_path, lines, "--async", "-j", "2") == 0
+    assert time.monotonic() - start >= 0.2
+    assert capsys.readouterr().out == "a\nb\nc\n"
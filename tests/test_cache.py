@@ -0,0 +1,112 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_cache.py
+
+"""Tests of the on-disk cache of rendered text (see CLI.Cache)."""
+
+import os
+import sys
+import importlib
+
+import pytest
+
+from CLI import Cache
+from CLI.Spec import Spec
+
+
+Source = '''
+import CLI
+
+class Tool(CLI.SingleMode):
+    """A tool."""
+
+    def __init__(self, argv):
+        super(Tool, self).__init__(argv)
+        self.path = CLI.Required("the path")
+        self.mode = CLI.Switch("the mode", "fast", "m")
+'''
+
+
+@pytest.fixture
+def Tool(tmp_path, monkeypatch):
+    """An application class defined in a module of its own (whose mtime may
+    change), with the cache in a fresh directory.
+    """
+
+    (tmp_path / "cached_tool.py").write_text(Source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("CLI_CACHE", str(tmp_path / "cache"))
+
+    cls = importlib.import_module("cached_tool").Tool
+    yield cls
+
+    sys.modules.pop("cached_tool", None)
+    Spec.Compiled.pop(Spec.key(cls), None)
+
+
+def touch(cls):
+    """Move the modification time of the source of *cls* forward."""
+    path = Cache.source_of(cls)
+    mtime = os.stat(path).st_mtime_ns + 10 ** 9
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_disabled(Tool, monkeypatch):
+    monkeypatch.delenv("CLI_CACHE")
+    assert Cache.path_for(Tool) is None
+    Cache.store(Tool, "text", "k", "value")
+    assert Cache.load(Tool, "text", "k") is None
+
+
+def test_load_what_was_stored(Tool):
+    Cache.store(Tool, "text", "k", ["usage", "help"])
+    assert Cache.load(Tool, "text", "k") == ["usage", "help"]
+    assert Cache.load(Tool, "text", "other") is None
+    assert Cache.load(Tool, "other", "k") is None
+
+
+def test_changed_source_discards_entries(Tool):
+    Cache.store(Tool, "text", "k", "value")
+    Cache.store(Tool, "more", "k", "value")
+    touch(Tool)
+    assert Cache.load(Tool, "text", "k") is None
+
+    Cache.store(Tool, "text", "k", "new")
+    assert Cache.load(Tool, "text", "k") == "new"
+    assert Cache.load(Tool, "more", "k") is None
+
+
+def test_unreadable_file_is_ignored(Tool):
+    os.makedirs(os.path.dirname(Cache.path_for(Tool)))
+    with open(Cache.path_for(Tool), "w") as stream:
+        stream.write("{not json")
+
+    assert Cache.load(Tool, "text", "k") is None
+    Cache.store(Tool, "text", "k", "value")
+    assert Cache.load(Tool, "text", "k") == "value"
+
+
+def test_text_is_not_rendered_again(Tool, monkeypatch):
+    app = Tool(["tool", "x"])
+    app.register()
+    text = app.rendered()
+
+    # as in a new process: the Spec is compiled again, with nothing rendered
+    Spec.Compiled.pop(Spec.key(Tool))
+    monkeypatch.setattr(Tool, "render", lambda self: pytest.fail("rendered again"))
+
+    app = Tool(["tool", "x"])
+    app.register()
+    assert tuple(app.rendered()) == tuple(text)
+
+
+def test_text_is_rendered_for_a_new_key(Tool):
+    app = Tool(["tool", "x"])
+    app.register()
+    app.rendered()
+
+    Spec.Compiled.pop(Spec.key(Tool))
+    app = Tool(["tool", "x"])
+    app.mode.description = "the other mode"
+    app.register()
+    assert "the other mode" in app.rendered()[1]
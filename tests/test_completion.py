@@ -0,0 +1,88 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_completion.py
+
+"""Tests of the shell completion of an application (see CLI.Completion)."""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+from CLI import Completion
+
+
+SOURCE = '''
+import CLI
+
+class Run(CLI.SingleMode):
+    """Run something."""
+
+    def __init__(self, argv):
+        super(Run, self).__init__(argv)
+        self.target  = CLI.Required("what to run")
+        self.level   = CLI.Switch("how hard", 3, "l")
+        self.verbose = CLI.Flag("say more", False, "v")
+
+class App(CLI.MultiMode):
+    """An application to complete."""
+
+    def __init__(self, argv):
+        super(App, self).__init__(argv)
+        self.SubCommands["run"] = Run
+        self.SubCommands["reset"] = Run
+        self.SubCommands["build"] = Run
+'''
+
+
+@pytest.fixture
+def target(tmp_path, monkeypatch):
+    """The `module:Class` of an application in a package of its own."""
+
+    package = tmp_path / "completed"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "app.py").write_text(textwrap.dedent(SOURCE))
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("CLI_CACHE", str(tmp_path / "cache"))
+
+    yield "completed.app:App"
+    for name in ("completed", "completed.app"):
+        sys.modules.pop(name, None)
+
+
+def test_complete(target):
+    index = Completion.index_for(target)
+    assert Completion.complete(index, [], "") == ["build", "reset", "run"]
+    assert Completion.complete(index, [], "r") == ["reset", "run"]
+    assert Completion.complete(index, [], "-") == ["--help", "-h"]
+    assert Completion.complete(index, ["run"], "--") == ["--help", "--level", "--verbose"]
+    assert Completion.complete(index, ["b"], "-") == ["--help", "--level", "--verbose",
+            "-h", "-l", "-v"]
+    assert Completion.complete(index, ["ru", "-l"], "") == ["3"]
+    assert Completion.complete(index, ["ru", "-l", "5"], "x") == []
+    assert Completion.complete(index, ["r"], "-") == ["--help", "-h"]
+
+
+def test_fresh_index_imports_nothing(target):
+    Completion.index_for(target)
+    for name in ("completed", "completed.app"):
+        del sys.modules[name]
+
+    Completion.index_for(target)
+    assert "completed" not in sys.modules
+
+
+def test_changed_source_rebuilds_the_index(target):
+    Completion.index_for(target)
+    path   = Completion.path_for(target)
+    origin = Completion.Cache.read(path)["origin"]
+
+    stat = os.stat(origin)
+    os.utime(origin, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not Completion.fresh(Completion.Cache.read(path))
+
+    Completion.index_for(target)
+    assert Completion.fresh(Completion.Cache.read(path))
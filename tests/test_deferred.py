@@ -0,0 +1,127 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_deferred.py
+
+"""Tests of lazy Arguments and callable defaults (see CLI.Deferred)."""
+
+import gc
+import weakref
+
+import pytest
+
+import CLI
+from CLI import Deferred
+
+
+class Lazy(CLI.SingleMode):
+    """An application with a lazy Switch and a callable default."""
+
+    calls = 0
+
+    def __init__(self, argv):
+        super(Lazy, self).__init__(argv)
+        self.size = CLI.Switch("the size", 1, "s", lazy=True)
+        self.home = CLI.Switch("the home", lambda: Lazy.computed(), "H", dtype=str)
+        self.mine = CLI.Switch("my own", lambda: self.name, "m", dtype=str)
+
+    @staticmethod
+    def computed():
+        Lazy.calls += 1
+        return "/home/lazy"
+
+    def main(self):
+        pass
+
+
+def run(*argv):
+    """Return the application, parsed and reassigned (without running *main*)."""
+    app = Lazy(["lazy"] + list(argv or ("-s", "1")))
+    app.prepare()
+    return app
+
+
+def test_lazy_value_is_coerced_on_use():
+    app = run("-s", "12")
+    assert isinstance(app.__dict__["size"], Deferred.Deferred)
+    assert app.size == 12
+    assert app.__dict__["size"] == 12
+
+
+def test_lazy_value_reports_errors_on_use():
+    app = run("-s", "twelve")
+    with pytest.raises(CLI.Error, match="`size`: `twelve` could not be converted to int"):
+        app.size
+
+
+def test_callable_default_is_computed_once():
+    calls = Lazy.calls
+    apps = [run() for _ in range(3)]
+    assert isinstance(apps[0].__dict__["home"], Deferred.Computed)
+    assert [app.home for app in apps] == ["/home/lazy"] * 3
+    assert Lazy.calls <= calls + 1
+
+
+def test_callable_default_is_not_called_when_given():
+    calls = Lazy.calls
+    Deferred.Results.clear()
+    assert run("-H", "/elsewhere").home == "/elsewhere"
+    assert Lazy.calls == calls
+
+
+def test_closures_over_self_are_not_kept():
+    before = len(Deferred.Results)
+    apps = [run() for _ in range(10)]
+    assert [app.mine for app in apps] == ["lazy"] * 10
+    assert len(Deferred.Results) <= before + 1
+
+    app = weakref.ref(apps.pop())
+    del apps
+    gc.collect()
+    assert app() is None
+
+
+def test_callable_default_requires_dtype():
+
+    class Untyped(CLI.SingleMode):
+        """A callable default without a dtype."""
+
+        def __init__(self, argv):
+            super(Untyped, self).__init__(argv)
+            self.port = CLI.Default("the port", lambda: 8080)
+
+    with pytest.raises(CLI.Error, match="`port`: a callable \\*default\\* requires a \\*dtype\\*"):
+        Untyped(["untyped"]).register()
+
+
+class Checked(CLI.SingleMode):
+    """An application with cheap checks on lazy values."""
+
+    limit = 10
+
+    def __init__(self, argv, member="port"):
+        super(Checked, self).__init__(argv)
+        self.__dict__[member] = CLI.Switch("the port", 80, "p", lazy=True, check=str.isdigit)
+        self.hosts = CLI.List("the hosts", lazy=True, check=lambda host: "." in host)
+
+    def main(self):
+        pass
+
+
+def test_check_fails_at_parse_time():
+    with pytest.raises(CLI.Error, match="`port`: `http` is not a valid value"):
+        Checked(["checked", "a.b", "-p", "http"]).prepare()
+
+    with pytest.raises(CLI.Error, match="`hosts`: `localhost` is not a valid value"):
+        Checked(["checked", "a.b", "localhost"]).prepare()
+
+    app = Checked(["checked", "a.b", "-p", "8080"])
+    app.prepare()
+    assert app.port == 8080 and list(app.hosts) == ["a.b"]
+
+
+@pytest.mark.parametrize("member", ["limit", "main", "each"])
+def test_members_do_not_replace_class_attributes(member):
+    with pytest.raises(CLI.Error, match="`{}` has the name of an attribute".format(member)):
+        Checked(["checked", "a.b", "-p", "1"], member).prepare()
+
+    assert Checked.limit == 10 and callable(Checked.main)
@@ -0,0 +1,62 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_fanout.py
+
+"""Tests of a SingleMode application that fans *each* out over its List (see
+CLI.FanOut).
+"""
+
+import sys
+
+import pytest
+
+import CLI
+
+
+class Square(CLI.SingleMode):
+    """Square some numbers."""
+
+    def __init__(self, argv, mode="thread"):
+        super(Square, self).__init__(argv)
+        self.numbers = CLI.List("the numbers", dtype=int)
+        self.fan_out = mode
+
+    def each(self, number):
+        if number == 7:
+            raise ValueError("seven")
+        if number == 8:
+            raise CLI.Error("eight is bad")
+        if number == 9:
+            sys.exit("nine")
+
+        print(number, number * number)
+        return 3 if number == 5 else 0
+
+
+@pytest.mark.parametrize("mode,jobs", [("thread", "1"), ("thread", "4"), ("process", "3")])
+def test_output_in_order(capsys, mode, jobs):
+    argv = ["square"] + [str(number) for number in range(1, 7)] + ["-j", jobs]
+    assert Square(argv, mode).Exe() == 3
+    assert capsys.readouterr().out == "".join("{} {}\n".format(number, number * number)
+            for number in range(1, 7))
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_failures_end_only_their_item(capsys, mode):
+    assert Square(["square", "7", "8", "9", "2", "-j", "2"], mode).Exe() == 1
+    output, error = capsys.readouterr()
+    assert output == "eight is bad\n2 4\n"
+    assert "ValueError: seven" in error and "nine\n" in error
+
+
+def test_fan_out_requires_each():
+
+    class Missing(CLI.SingleMode):
+        """No *each*."""
+
+        def __init__(self, argv):
+            super(Missing, self).__init__(argv)
+            self.items   = CLI.List("the items")
+            self.fan_out = "thread"
+
+    assert Missing(["missing", "a"]).Exe() == 1
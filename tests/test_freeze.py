@@ -0,0 +1,106 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_freeze.py
+
+"""Tests of the frozen parser generated by CLI.Freeze."""
+
+import os
+import textwrap
+import importlib
+
+import pytest
+
+import CLI
+from CLI import Freeze
+from CLI.Spec import Spec
+
+
+SOURCE = '''
+import CLI
+
+class App(CLI.SingleMode):
+    """An application to freeze."""
+
+    def __init__(self, argv):
+        super(App, self).__init__(argv)
+        self.count   = CLI.Required("how many", dtype=int)
+        self.verbose = CLI.Flag("say more", False, "v")
+
+    def main(self):
+        print(self.count, self.verbose)
+'''
+
+
+@pytest.fixture
+def App(tmp_path, monkeypatch):
+    """The App class, from a module of its own (so that it has a source file)."""
+
+    (tmp_path / "frozen_app.py").write_text(textwrap.dedent(SOURCE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(Spec, "Compiled", {})
+
+    module = importlib.import_module("frozen_app")
+    yield module.App
+    del importlib.sys.modules["frozen_app"]
+
+
+def freeze(App):
+    """Install the frozen Spec for the App."""
+    source = Freeze.render("frozen_app:App", App, "app")
+    exec(compile(source, "<frozen>", "exec"), {"__name__": "frozen"})
+    return Spec.lookup(App)
+
+
+def test_check_finds_no_differences(App):
+    source  = Freeze.render("frozen_app:App", App, "app")
+    samples = Freeze.samples_for(App, "app") + [["3", "-v"], ["x"]]
+    assert Freeze.check(App, "app", source, samples) == []
+
+
+def test_frozen_spec_is_used(App, capsys):
+    spec = freeze(App)
+    assert App(["app", "3", "-v"]).Exe() is None
+    assert capsys.readouterr().out == "3 True\n"
+    assert Spec.lookup(App) is spec and spec.frozen
+
+
+def test_new_member_is_registered(App, capsys):
+    freeze(App)
+
+    init = App.__init__
+    def __init__(self, argv):
+        init(self, argv)
+        self.quiet = CLI.Flag("say less", False, "q")
+
+    App.__init__ = __init__
+    App.main = lambda self: print(self.count, self.verbose, self.quiet)
+
+    App(["app", "3", "-q"]).Exe()
+    assert capsys.readouterr().out == "3 False True\n"
+    assert not Spec.lookup(App).frozen
+
+
+def test_renamed_member_is_registered(App, capsys):
+    freeze(App)
+
+    init = App.__init__
+    def __init__(self, argv):
+        init(self, argv)
+        self.loud = self.__dict__.pop("verbose")
+
+    App.__init__ = __init__
+    App.main = lambda self: print(self.count, self.loud)
+
+    App(["app", "3", "--loud"]).Exe()
+    assert capsys.readouterr().out == "3 True\n"
+
+
+def test_changed_source_is_not_trusted(App):
+    freeze(App)
+
+    path = importlib.sys.modules["frozen_app"].__file__
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    App(["app", "3"]).Exe()
+    assert not Spec.lookup(App).frozen
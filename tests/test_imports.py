@@ -0,0 +1,25 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_imports.py
+
+"""Tests that the optional subsystems stay off the import path of `import CLI`."""
+
+import os
+import sys
+import subprocess
+
+
+def run(code, *args):
+    """Run the *code* in a new interpreter; return the completed process."""
+    return subprocess.run([sys.executable, "-c", code] + list(args),
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+
+def test_import_is_light():
+    result = run("import sys, CLI; print(' '.join(sorted(sys.modules)))")
+    modules = set(result.stdout.split())
+    for name in ("CLI.Batch", "CLI.Shell", "CLI.Completion", "CLI.FanOut", "CLI.Runner",
+            "CLI.Response", "CLI.Writer", "CLI.Cache", "json", "shlex", "threading"):
+        assert name not in modules
+
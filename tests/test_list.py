@@ -0,0 +1,58 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_list.py
+
+"""Tests of the values of a List: lazy (see CLI.LazyList) and arrays."""
+
+import pytest
+
+import CLI
+
+
+class Numbers(CLI.SingleMode):
+    """An application with a List of numbers."""
+
+    def __init__(self, argv, **options):
+        super(Numbers, self).__init__(argv)
+        self.values = CLI.List("the numbers", **options)
+
+
+def parse(*values, **options):
+    """The value of the List given the *values*, for the List *options*."""
+    app = Numbers(["numbers"] + list(values), **options)
+    app.rc()
+    return app.values.value
+
+
+def test_lazy_values_are_coerced_on_access():
+    values = parse("1", "2", "x", dtype=int, lazy=True)
+    assert len(values) == 3
+    assert values[0] == 1 and values[-2] == 2 and values[:2] == [1, 2]
+
+    with pytest.raises(CLI.Error, match="element 2 \\(`x`\\)"):
+        values[2]
+
+    with pytest.raises(CLI.Error, match="element 2"):
+        list(values)
+
+
+@pytest.mark.parametrize("index", [3, -4, -5])
+def test_lazy_index_out_of_range(index):
+    with pytest.raises(IndexError):
+        parse("1", "2", "3", dtype=int, lazy=True)[index]
+
+
+def test_array_values():
+    values = parse("1", "2", "3", dtype=int, array=True)
+    assert list(values) == [1, 2, 3]
+    assert list(parse("0.5", "2", dtype=float, array=True)) == [0.5, 2.0]
+
+
+def test_array_reports_the_bad_element():
+    with pytest.raises(CLI.Error, match="element 1 \\(`x`\\)"):
+        parse("1", "x", dtype=int, array=True)
+
+
+def test_array_requires_a_numeric_dtype():
+    with pytest.raises(CLI.Error, match="requires a \\*dtype\\* of int or float"):
+        CLI.List("strings", array=True)
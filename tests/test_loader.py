@@ -0,0 +1,33 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_loader.py
+
+"""Tests of the resolution of the lazy SubCommands of a MultiMode."""
+
+import CLI
+from CLI import Loader
+
+
+def test_lambda_loaders_are_resolved_once():
+    before = len(Loader.Resolved)
+    for _ in range(100):
+        assert Loader.resolve(lambda: CLI.SingleMode) is CLI.SingleMode
+
+    assert len(Loader.Resolved) == before + 1
+
+
+def test_import_strings_are_loaded():
+    assert Loader.resolve("CLI.SingleMode:SingleMode") is CLI.SingleMode
+
+
+def test_loaders_using_instances_are_not_kept():
+
+    class Holder(object):
+        cls = CLI.SingleMode
+
+    before = len(Loader.Resolved)
+    for _ in range(10):
+        holder = Holder()
+        assert Loader.resolve(lambda: holder.cls) is CLI.SingleMode
+
+    assert len(Loader.Resolved) == before
@@ -0,0 +1,43 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_parse.py
+
+"""CLI.parse must agree with *rc* on random command lines (the values, or the
+error message), and must be safe to call from many threads at once.
+"""
+
+import threading
+
+import pytest
+
+import CLI
+from apps import A, B, command_lines, outcome, by_rc
+
+
+def by_parse(cls, argv):
+    """Parse with CLI.parse; the values by member name."""
+    return CLI.parse(cls, ["p"] + argv)._asdict()
+
+
+@pytest.mark.parametrize("cls", [A, B])
+def test_parse_matches_rc(cls):
+    for argv in command_lines(3000):
+        assert outcome(by_parse, cls, argv) == outcome(by_rc, cls, argv), argv
+
+
+def test_parse_is_reentrant():
+    errors = []
+
+    def work():
+        for _ in range(500):
+            values = CLI.parse(A, ["p", "3", "-f", "--t", "z", "7", "8", "9"])
+            if tuple(values)[1:] != (3, 7, "8", 1.0, "z", True, ["9"]):
+                errors.append(values)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
@@ -0,0 +1,65 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_response.py
+
+"""Tests of `@path` response files (see CLI.Response)."""
+
+import os
+import threading
+
+import pytest
+
+import CLI
+from CLI.Response import expand
+
+
+def test_regular_file(tmp_path):
+    path = tmp_path / "args"
+    path.write_bytes(b"a\r\nb c\n\nd\n")
+    assert list(expand(["x", "@{}".format(path), "y"])) == ["x", "a", "b c", "d", "y"]
+
+
+def test_nul_delimited(tmp_path):
+    path = tmp_path / "args"
+    path.write_bytes(b"a\nb\0c\0")
+    assert list(expand(["@{}".format(path)])) == ["a\nb", "c"]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "args"
+    path.write_bytes(b"")
+    assert list(expand(["@{}".format(path), "z"])) == ["z"]
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(CLI.Error):
+        list(expand(["@{}".format(tmp_path / "missing")]))
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="needs /dev/fd")
+def test_pipe():
+    # as with `app @<(find . -print0)`; a pipe reports a size of zero
+    read, write = os.pipe()
+    os.write(write, b"./a\0./b\0")
+    os.close(write)
+    try:
+        assert list(expand(["@/dev/fd/{}".format(read)])) == ["./a", "./b"]
+    finally:
+        os.close(read)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs mkfifo")
+def test_fifo(tmp_path):
+    path = str(tmp_path / "fifo")
+    os.mkfifo(path)
+
+    def writer():
+        with open(path, "wb") as stream:
+            stream.write(b"x\ny\n")
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        assert list(expand(["@" + path])) == ["x", "y"]
+    finally:
+        thread.join()
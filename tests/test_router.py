@@ -0,0 +1,61 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_router.py
+
+"""Tests of CLI.Router, which runs command strings and returns the output."""
+
+import pytest
+
+import CLI
+from CLI.Router import Router
+
+
+class Echo(CLI.SingleMode):
+    """Print the words."""
+
+    def __init__(self, argv):
+        super(Echo, self).__init__(argv)
+        self.words = CLI.List("the words to print")
+
+    def main(self):
+        print(" ".join(self.words))
+
+
+class DB(CLI.MultiMode):
+    """A nested MultiMode."""
+
+    def __init__(self, argv):
+        super(DB, self).__init__(argv)
+        self.SubCommands["echo"] = Echo
+
+
+class Top(CLI.MultiMode):
+    """The top level application."""
+
+    def __init__(self, argv):
+        super(Top, self).__init__(argv)
+        self.SubCommands["db"] = DB
+        self.SubCommands["echo"] = Echo
+
+
+def test_route_returns_the_output():
+    route = Router(Top)
+    assert route("echo a 'b c'") == (0, "a b c\n", "")
+    assert route("db echo x") == (0, "x\n", "")
+    assert route("d e y") == (0, "y\n", "")
+
+
+def test_route_reports_errors():
+    route = Router(Top)
+    assert route("nope").code == 2
+    assert route("echo 'unbalanced").code == 2
+
+
+@pytest.mark.parametrize("command", ["--batch -", "db --batch -", "d --batch -", "shell",
+    "db shell"])
+def test_route_refuses_batch_and_shell(command, monkeypatch):
+    # the command must fail rather than read a file or stdin
+    monkeypatch.setattr("sys.stdin", None)
+    result = Router(Top)(command)
+    assert result.code != 0
+    assert "Traceback" not in result.error
@@ -0,0 +1,81 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_server.py
+
+"""Tests of the fork server and its client (see CLI.Server, CLI.Client)."""
+
+import os
+import sys
+import time
+import socket
+import subprocess
+
+import pytest
+
+import CLI
+
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX") or not hasattr(os, "fork"),
+        reason="needs Unix domain sockets and fork")
+
+
+class Status(CLI.SingleMode):
+    """Exit with the status named on the command line."""
+
+    def __init__(self, argv):
+        super(Status, self).__init__(argv)
+        self.status = CLI.Required("what to return")
+
+    def main(self):
+        if self.status == "message":
+            # as with sys.exit("..."), printed and an exit status of one
+            return "failed: message"
+        if self.status == "big":
+            return 2 ** 40 + 3
+        return int(self.status)
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Start a server for Status; yield the path of its socket."""
+
+    path = str(tmp_path / "socket")
+    env  = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.Popen([sys.executable, "-m", "CLI.Server", "test_server:Status",
+        path], env=env)
+    try:
+        for _ in range(200):
+            if os.path.exists(path):
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("the server did not start")
+
+        yield path
+
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def client(path, *argv):
+    """Run the client for the *argv*; return (status, stderr)."""
+    result = subprocess.run([sys.executable, "-m", "CLI.Client", path] + list(argv),
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    return result.returncode, result.stderr
+
+
+def test_exit_status(server):
+    assert client(server, "0") == (0, "")
+    assert client(server, "3") == (3, "")
+
+
+def test_non_int_status(server):
+    # the child must exit rather than fall back into the server
+    for _ in range(3):
+        assert client(server, "message") == (1, "failed: message\n")
+
+    assert os.path.exists(server)
+    assert client(server, "big") == (3, "")
+    assert client(server, "0") == (0, "")
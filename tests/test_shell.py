@@ -0,0 +1,95 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_shell.py
+
+"""Tests of the interactive shell of a MultiMode application (see CLI.Shell)."""
+
+import io
+import os
+import sys
+import subprocess
+
+import CLI
+from CLI.Shell import Shell
+
+
+class Say(CLI.SingleMode):
+    """Print a word and exit with a status."""
+
+    def __init__(self, argv):
+        super(Say, self).__init__(argv)
+        self.word   = CLI.Required("the word")
+        self.status = CLI.Default("the exit status", 0)
+
+    def main(self):
+        print(self.word)
+        return self.status
+
+
+class Tool(CLI.MultiMode):
+    """The application the shell runs."""
+
+    def __init__(self, argv):
+        super(Tool, self).__init__(argv)
+        self.SubCommands["say"] = Say
+
+
+def shell(*argv):
+    """A Shell for the Tool."""
+    return Shell(["tool shell"] + list(argv), app=Tool, program="tool")
+
+
+def run(code):
+    """Run the *code* in a new interpreter; return the completed process."""
+    return subprocess.run([sys.executable, "-c", code],
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+
+def test_completion_runs_cleanly():
+    # runpy warns if CLI.Completion was imported by `import CLI` (via the Shell)
+    result = run("import runpy; runpy.run_module('CLI.Completion', run_name='__main__')")
+    assert "RuntimeWarning" not in result.stderr
+
+
+def test_run_dispatches_a_line(capsys):
+    app = shell()
+    assert app.run("say 'a b' 3  # a comment")
+    assert app.status == 3
+    assert capsys.readouterr().out == "a b\n"
+
+    assert app.run("say c")
+    assert app.status == 0
+
+
+def test_run_skips_blank_lines(capsys):
+    app = shell()
+    app.status = 5
+    assert app.run("") and app.run("   ") and app.run("# nothing")
+    assert app.status == 5
+    assert capsys.readouterr() == ("", "")
+
+
+def test_run_reports_a_bad_line(capsys):
+    app = shell()
+    assert app.run("say 'unbalanced")
+    assert app.status == 0
+    assert "quotation" in capsys.readouterr().err
+
+
+def test_run_stays_in_the_shell(capsys):
+    app = shell()
+    assert app.run("shell")
+    assert capsys.readouterr().err == "Already in the shell.\n"
+
+
+def test_run_leaves_the_shell():
+    assert not shell().run("exit")
+    assert not shell().run("quit now")
+
+
+def test_main_reads_lines_until_exit(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("say one\nsay two 4\nexit\nsay three\n"))
+    history = str(tmp_path / "history")
+    assert shell("-H", history).Exe() == 4
+    assert capsys.readouterr().out == "one\ntwo\n"
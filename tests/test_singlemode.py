@@ -0,0 +1,30 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_singlemode.py
+
+"""Differential tests of *rc*: random command lines are parsed by *rc* and by
+the reference parser (see reference.py), which must agree on the outcome (the
+values, or that usage is shown).
+"""
+
+import pytest
+
+import CLI
+from apps import A, B, command_lines, outcome, by_rc
+from reference import reference
+
+
+def by_reference(cls, argv):
+    """Parse with the reference parser; the values by member name."""
+    app = cls(["p"])
+    app.register()
+    values = reference(app, argv)
+    if values is None:
+        raise CLI.Usage(None)
+    return values
+
+
+@pytest.mark.parametrize("cls", [A, B])
+def test_rc_matches_reference(cls):
+    for argv in command_lines(3000):
+        assert outcome(by_rc, cls, argv) == outcome(by_reference, cls, argv), argv
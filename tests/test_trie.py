@@ -0,0 +1,102 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_trie.py
+
+"""Tests of the dispatch of (abbreviated) subcommands and of the suggestions
+for unknown ones (see CLI.Trie and CLI.Suggestions).
+"""
+
+import pytest
+
+import CLI
+from CLI.Trie import Trie
+from CLI.Spec import Spec
+from CLI.Suggestions import Suggestions
+from CLI.Completion import abbreviates
+
+
+NAMES = ["status", "stash", "start", "st", "commit", "config"]
+
+
+@pytest.mark.parametrize("word,matches", [
+    ("status", ["status"]),
+    ("stat", ["status"]),
+    ("sta", ["start", "stash", "status"]),
+    ("st", ["st"]),
+    ("com", ["commit"]),
+    ("co", ["commit", "config"]),
+    ("x", []),
+    ("", sorted(NAMES)),
+])
+def test_match(word, matches):
+    assert Trie(NAMES).match(word) == matches
+
+
+@pytest.mark.parametrize("word", ["status", "stat", "sta", "st", "co", "x", "commits"])
+def test_completion_abbreviates_like_dispatch(word):
+    matches = Trie(NAMES).match(word)
+    assert abbreviates(word, NAMES) == (matches[0] if len(matches) == 1 else None)
+
+
+def test_suggestions():
+    suggestions = Suggestions(NAMES)
+    assert suggestions.suggest("comit") == ["commit"]
+    assert suggestions.suggest("stsh") == ["stash"]
+    assert suggestions.suggest("xylophone") == []
+
+
+class Run(CLI.SingleMode):
+    """Print the name of the command."""
+
+    def __init__(self, argv):
+        super(Run, self).__init__(argv)
+        self.args = CLI.List("anything")
+
+    def main(self):
+        print(self.name)
+
+
+class Git(CLI.MultiMode):
+    """An application with many subcommands."""
+
+    def __init__(self, argv):
+        super(Git, self).__init__(argv)
+        for name in NAMES:
+            self.SubCommands[name] = Run
+
+
+def test_dispatch(capsys):
+    assert Git(["git", "stat", "x"]).Exe() is None
+    assert capsys.readouterr().out == "status\n"
+
+    assert Git(["git", "sta", "x"]).Exe() == 2
+    assert "ambiguous" in capsys.readouterr().out
+
+    assert Git(["git", "comit", "x"]).Exe() == 2
+    assert "Did you mean `commit`?" in capsys.readouterr().out
+
+
+def test_trie_is_built_once_per_class():
+    Git(["git", "st", "x"]).Exe()
+    trie = Spec.lookup(Git).trie(())
+    for _ in range(3):
+        Git(["git", "co", "x"]).Exe()
+
+    assert Spec.lookup(Git).trie(()) is trie
+
+
+def test_other_subcommands_recompile_the_spec(capsys):
+
+    class More(Git):
+        """As Git, with another subcommand."""
+
+        def __init__(self, argv):
+            super(More, self).__init__(argv)
+            if argv[1:2] == ["comet"]:
+                self.SubCommands["comet"] = Run
+
+    assert More(["more", "comet", "x"]).Exe() is None
+    assert capsys.readouterr().out == "comet\n"
+
+    assert More(["more", "come", "x"]).Exe() == 2
+    assert "`come` is not an available subcommand!" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+# Copyright (c) Geoffrey Lentner 2015. All rights reserved.
+# GNU General Public License v3.0, see LICENSE file.
+# tests/test_writer.py
+
+"""Tests of the help and usage statements, and of their wrapping (see
+CLI.Writer).
+"""
+
+import io
+
+import pytest
+
+import CLI
+from CLI.Writer import Writer, display
+from apps import A
+
+
+def test_usage_is_printable():
+    app = A(["p", "-h"])
+    with pytest.raises(CLI.Usage) as info:
+        app.rc()
+
+    text = str(info.value)
+    assert text.startswith("usage: p r [d 5]")
+    assert text == str(info.value.args[0]) == app.help_statement()
+
+
+def wrapped(text, width):
+    """The *text* written through a Writer of the *width*."""
+    stream = io.StringIO()
+    writer = Writer(stream, width)
+    for piece in text:
+        writer.write(piece)
+    writer.close()
+    return stream.getvalue()
+
+
+def test_no_width_writes_through():
+    text = "usage: p " + "[-x | --x 1] " * 20 + "\n"
+    assert wrapped([text], None) == text
+
+
+def test_usage_wraps_under_the_first_argument():
+    text = "usage: prog first [-a | --alpha 1] [-b | --beta 2] [-c | --gamma 3]\n"
+    assert wrapped([text], 40) == (
+        "usage: prog first [-a | --alpha 1]\n"
+        "            [-b | --beta 2]\n"
+        "            [-c | --gamma 3]\n")
+
+
+def test_help_wraps_under_the_description():
+    pieces = [" -v, --verbose    say a great deal ", "more about what is happening\n"]
+    assert wrapped(pieces, 36) == (
+        " -v, --verbose    say a great deal\n"
+        "                  more about what is\n"
+        "                  happening\n")
+
+
+def test_long_words_are_not_broken():
+    assert wrapped(["short " + "x" * 30 + " end\n"], 20) == "short\n" + "x" * 30 + "\nend\n"
+
+
+def test_display_writes_pieces(capsys):
+    display(iter(["a", "b"]))
+    display(CLI.Usage("text").args[0])
+    assert capsys.readouterr().out == "ab\ntext\n"